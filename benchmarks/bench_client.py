@@ -0,0 +1,243 @@
+"""Benchmarks the client's hot paths against the local mock server
+
+Every scenario is ran against `ciberedev.testing.MockServer`, so no requests are sent to the real api.
+Each one is timed first, then ran again with tracemalloc to measure its allocations, since tracing slows everything down.
+The RSS column is the peak of the whole process so far, so it can only grow from one scenario to the next.
+
+Usage:
+    python benchmarks/bench_client.py
+    python benchmarks/bench_client.py --requests 2000 --latency 0.005 --json results.json
+    python benchmarks/bench_client.py --baseline results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, List, Optional
+
+import ciberedev
+from ciberedev.testing import MockServer
+
+# typing.List, since this alias is evaluated at runtime and `list[float]` needs python 3.9
+Scenario = Callable[[ciberedev.Client, int], Awaitable[List[float]]]
+
+
+async def timed(latencies: list[float], coro: Awaitable[Any]) -> None:
+    started = time.perf_counter()
+    await coro
+    latencies.append(time.perf_counter() - started)
+
+
+async def single_calls(client: ciberedev.Client, amount: int) -> list[float]:
+    latencies: list[float] = []
+    for _ in range(amount):
+        await timed(latencies, client.get_random_words(1))
+    return latencies
+
+
+async def concurrent_calls(client: ciberedev.Client, amount: int) -> list[float]:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(32)
+
+    async def call(index: int) -> None:
+        async with semaphore:
+            await timed(latencies, client.get_search_results(f"query {index}"))
+
+    await asyncio.gather(*[call(index) for index in range(amount)])
+    return latencies
+
+
+async def batch_calls(client: ciberedev.Client, amount: int) -> list[float]:
+    latencies: list[float] = []
+    urls = (f"https://example.com/{index}" for index in range(amount))
+
+    started = time.perf_counter()
+    async for _, result in client.take_screenshots(urls, concurrency=16):
+        if isinstance(result, Exception):
+            raise result
+
+        # the batch yields in completion order, so this is the time between results
+        now = time.perf_counter()
+        latencies.append(now - started)
+        started = now
+    return latencies
+
+
+async def image_downloads(client: ciberedev.Client, amount: int) -> list[float]:
+    latencies: list[float] = []
+    for index in range(amount):
+        await timed(latencies, client.take_screenshot(f"https://example.com/{index}"))
+    return latencies
+
+
+async def streamed_downloads(client: ciberedev.Client, amount: int) -> list[float]:
+    latencies: list[float] = []
+
+    async def download(index: int) -> None:
+        file = await client.take_screenshot(f"https://example.com/{index}", stream=True)
+        async for _ in file:
+            pass
+
+    for index in range(amount):
+        await timed(latencies, download(index))
+    return latencies
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "single": single_calls,
+    "concurrent": concurrent_calls,
+    "batch": batch_calls,
+    "download": image_downloads,
+    "stream": streamed_downloads,
+}
+
+
+def percentile(latencies: list[float], q: float) -> float:
+    # the latencies are sorted, and the benchmarks are small enough to keep every one of them
+    return latencies[min(int(q * len(latencies)), len(latencies) - 1)]
+
+
+def process_peak_rss_kib() -> int:
+    # ru_maxrss is the peak over the lifetime of the process, not just the current scenario
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kibibytes, while macos reports bytes
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+async def run_scenario(
+    server: MockServer, scenario: Scenario, amount: int
+) -> dict[str, Any]:
+    async with server.client(coalesce_requests=False) as client:
+        # warms up the connection pool, so the first requests don't skew the results
+        await scenario(client, min(amount, 10))
+
+        started = time.perf_counter()
+        latencies = sorted(await scenario(client, amount))
+        elapsed = time.perf_counter() - started
+
+        tracemalloc.start()
+        try:
+            await scenario(client, amount)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_alloc_kib": peak / 1024,
+        "process_peak_rss_kib": process_peak_rss_kib(),
+    }
+
+
+def print_results(results: dict[str, dict[str, Any]]) -> None:
+    header = f"{'scenario':<12}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'alloc KiB':>12}{'peak rss KiB':>14}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        print(
+            f"{name:<12}{result['rps']:>10.0f}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+            f"{result['peak_alloc_kib']:>12.0f}{result['process_peak_rss_kib']:>14}"
+        )
+
+
+def find_regressions(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+
+        if result["rps"] < old["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: req/s dropped from {old['rps']:.0f} to {result['rps']:.0f}"
+            )
+        if result["p99_ms"] > old["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 rose from {old['p99_ms']:.2f}ms to {result['p99_ms']:.2f}ms"
+            )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    names = args.scenarios or list(SCENARIOS)
+    results: dict[str, dict[str, Any]] = {}
+
+    async with MockServer(
+        latency=args.latency, image_size=args.image_size, seed=0
+    ) as server:
+        for name in names:
+            results[name] = await run_scenario(server, SCENARIOS[name], args.requests)
+
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=4)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help=f"the scenarios to run. Defaults to all of them: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=500, help="the amount of requests per scenario"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="the latency of the mock server"
+    )
+    parser.add_argument(
+        "--image-size",
+        type=int,
+        default=256 * 1024,
+        help="the size of the images, in bytes",
+    )
+    parser.add_argument("--json", help="the file the results are written to")
+    parser.add_argument(
+        "--baseline",
+        help="a results file to compare against, which fails on regressions",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="how much worse than the baseline a result can be",
+    )
+    args = parser.parse_args(argv)
+
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r}")
+    return args
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -8,14 +8,26 @@ A basic wrapper cibere.dev
 """
 
 __description__ = "A basic wrapper cibere.dev"
-__version__ = "0.5.2"
+__version__ = "0.6.0"
 
 from typing import Literal, NamedTuple
 
+from .cache import *
+from .circuitbreaker import *
 from .client import *
+from .endpoints import *
 from .errors import *
 from .file import *
+from .metrics import *
+from .pipeline import *
+from .pool import *
+from .processing import *
+from .retries import *
 from .searching import *
+from .sync import *
+from .timeouts import *
+from .tracing import *
+from .words import *
 
 
 class VersionInfo(NamedTuple):
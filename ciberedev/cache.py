@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Union
+
+from .file import File
+
+__all__ = ["ResponseCache", "DiskCache"]
+
+LOGGER = logging.getLogger(__name__)
+DISK_CACHE_MAGIC = b"CDC1"
+DISK_CACHE_HEADER = struct.Struct(">4sdI")
+DISK_CACHE_SUFFIX = ".cache"
+
+DEFAULT_TTLS = {
+    "/search": 60.0,
+    "/image/ascii": 300.0,
+    "/ping": 5.0,
+}
+
+
+class ResponseCache:
+    ttls: dict[str, float]
+    max_entries: int
+    max_bytes: Optional[int]
+    hits: int
+    misses: int
+
+    __slots__ = [
+        "ttls",
+        "max_entries",
+        "max_bytes",
+        "hits",
+        "misses",
+        "_entries",
+        "_size",
+    ]
+
+    def __init__(
+        self,
+        *,
+        ttls: Optional[dict[str, float]] = None,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+    ):
+        """Creates an in-memory cache for the responses of the api's GET endpoints
+
+        When passed to `ciberedev.client.Client`, responses of `/search`, `/image/ascii` and `/ping` are cached,
+        and concurrent identical requests share a single request to the api.
+        Once the cache is full, the least recently used responses are evicted first.
+
+        Parameters
+        ----------
+        ttls: Optional[dict[`str`, `float`]]
+            How long, in seconds, responses of each endpoint are cached for. Ex: `{"/search": 10}`.
+            These are merged with the defaults of `60` for `/search`, `300` for `/image/ascii` and `5` for `/ping`.
+            Setting an endpoint's ttl to `0` disables caching for it
+        max_entries: `int`
+            The max amount of responses that are cached at once. Defaults to `1024`
+        max_bytes: Optional[`int`]
+            The max total size of the cached responses, in bytes. Defaults to no limit
+
+        Attributes
+        ----------
+        ttls: dict[`str`, `float`]
+            How long, in seconds, responses of each endpoint are cached for
+        max_entries: `int`
+            The max amount of responses that are cached at once
+        max_bytes: Optional[`int`]
+            The max total size of the cached responses, in bytes
+        hits: `int`
+            The amount of requests that were answered from the cache
+        misses: `int`
+            The amount of cacheable requests that had to be sent to the api
+        """
+
+        if max_entries < 1:
+            raise TypeError("max_entries must be atleast 1")
+
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._size = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<ResponseCache entries={len(self)} hits={self.hits} misses={self.misses}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached responses, in bytes"""
+
+        return self._size
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Gives you how long responses of the given endpoint are cached for
+
+        Parameters
+        ----------
+        endpoint: `str`
+            the endpoint. Ex: '/search'
+
+        Returns
+        ----------
+        float
+            the ttl in seconds. `0` means the endpoint is not cached
+        """
+
+        return self.ttls.get(endpoint, 0.0)
+
+    def get(self, key: Hashable) -> Any:
+        """Gets a cached response
+
+        Parameters
+        ----------
+        key: `Hashable`
+            the key of the response
+
+        Raises
+        ----------
+        KeyError
+            The response is not cached, or it expired
+
+        Returns
+        ----------
+        Any
+            the cached response
+        """
+
+        expires_at, size, value = self._entries[key]
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._size -= size
+            raise KeyError(key)
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, *, ttl: float, size: int = 0) -> None:
+        """Caches a response
+
+        Parameters
+        ----------
+        key: `Hashable`
+            the key of the response
+        value: `Any`
+            the response
+        ttl: `float`
+            how long, in seconds, the response should be cached for
+        size: `int`
+            the size of the response, in bytes
+        """
+
+        if ttl <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= old[1]
+
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self._size += size
+
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._size > self.max_bytes
+        ):
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+
+    def clear(self) -> None:
+        """Removes every cached response"""
+
+        self._entries.clear()
+        self._size = 0
+
+
+def _remove(filepath: str) -> None:
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
+
+
+def _hash_param(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"sha256": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+class DiskCache:
+    path: str
+    max_size: int
+    max_age: Optional[float]
+    hits: int
+    misses: int
+
+    __slots__ = [
+        "path",
+        "max_size",
+        "max_age",
+        "hits",
+        "misses",
+        "_index",
+        "_size",
+        "_lock",
+    ]
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        /,
+        *,
+        max_size: int = 512 * 1024 * 1024,
+        max_age: Optional[float] = None,
+    ):
+        """Creates a persistent on-disk cache for the images returned by the client
+
+        When passed to `ciberedev.client.Client`, the results of `take_screenshot`, `add_text_to_image`,
+        `image_laugh` and `invert_image` are stored on disk, keyed by a hash of the request's parameters
+        (or of the image's bytes), so identical requests are served from disk, even after a restart.
+        Cached images are memory-mapped instead of being read into memory.
+
+        Only requests that download the image right away are cached, so `fetch=False` and `stream=True` skip the cache.
+
+        Parameters
+        ----------
+        path: Union[`str`, `os.PathLike`]
+            the directory the cache is stored in. It is created if it does not exist
+        max_size: `int`
+            The max total size of the cache, in bytes. Once it is exceeded, the least recently used images are removed. Defaults to 512 MiB
+        max_age: Optional[`float`]
+            How long, in seconds, an image is cached for. Defaults to forever
+
+        Attributes
+        ----------
+        path: `str`
+            the directory the cache is stored in
+        max_size: `int`
+            The max total size of the cache, in bytes
+        max_age: Optional[`float`]
+            How long, in seconds, an image is cached for
+        hits: `int`
+            The amount of requests that were answered from the cache
+        misses: `int`
+            The amount of cacheable requests that had to be sent to the api
+        """
+
+        self.path = os.fspath(path)
+        self.max_size = max_size
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+        self._index: Optional[OrderedDict[str, int]] = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<DiskCache path={self.path!r} hits={self.hits} misses={self.misses}>"
+
+    @staticmethod
+    def make_key(method: str, /, **params: Any) -> str:
+        """Creates a cache key from the name of a method and its parameters
+
+        Bytes are hashed, so the key of a request that uploads an image does not depend on its size.
+
+        Parameters
+        ----------
+        method: `str`
+            the name of the method. Ex: 'take_screenshot'
+        **params: `Any`
+            the parameters of the request
+
+        Returns
+        ----------
+        str
+            the key
+        """
+
+        normalized = {name: _hash_param(value) for name, value in params.items()}
+        raw = json.dumps([method, normalized], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _filepath(self, key: str) -> str:
+        return os.path.join(self.path, key + DISK_CACHE_SUFFIX)
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is not None:
+            return self._index
+
+        os.makedirs(self.path, exist_ok=True)
+
+        entries: list[tuple[float, str, int]] = []
+        for entry in os.scandir(self.path):
+            if not entry.is_file():
+                continue
+            if entry.name.startswith(".tmp-"):
+                # left behind by a write that never finished
+                _remove(entry.path)
+                continue
+            if not entry.name.endswith(DISK_CACHE_SUFFIX):
+                continue
+
+            stat = entry.stat()
+            key = entry.name[: -len(DISK_CACHE_SUFFIX)]
+            entries.append((stat.st_mtime, key, stat.st_size))
+
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._size = sum(size for _, _, size in entries)
+        return self._index
+
+    def _get(self, key: str) -> Optional[File]:
+        with self._lock:
+            index = self._load_index()
+            if key not in index:
+                return None
+
+            filepath = self._filepath(key)
+            try:
+                with open(filepath, "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._forget(key)
+                return None
+
+            try:
+                magic, created_at, url_length = DISK_CACHE_HEADER.unpack_from(mapped)
+            except struct.error:
+                magic, created_at, url_length = b"", 0.0, 0
+
+            if magic != DISK_CACHE_MAGIC or (
+                self.max_age is not None and time.time() - created_at > self.max_age
+            ):
+                mapped.close()
+                self._forget(key)
+                _remove(filepath)
+                return None
+
+            start = DISK_CACHE_HEADER.size
+            url = mapped[start : start + url_length].decode("utf-8") or None
+
+            index.move_to_end(key)
+            try:
+                os.utime(filepath)
+            except OSError:
+                pass
+
+        return File(raw_bytes=memoryview(mapped)[start + url_length :], url=url)
+
+    def _set(self, key: str, file: File) -> None:
+        url = (file.url or "").encode("utf-8")
+        header = DISK_CACHE_HEADER.pack(DISK_CACHE_MAGIC, time.time(), len(url))
+        data = file.view
+        size = len(header) + len(url) + len(data)
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            index = self._load_index()
+
+            fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=self.path)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(header)
+                    f.write(url)
+                    f.write(data)
+                os.replace(tmp, self._filepath(key))
+            except BaseException:
+                _remove(tmp)
+                raise
+
+            self._forget(key)
+            index[key] = size
+            self._size += size
+
+            while self._size > self.max_size and index:
+                evicted, _ = next(iter(index.items()))
+                self._forget(evicted)
+                _remove(self._filepath(evicted))
+
+    def _forget(self, key: str) -> None:
+        assert self._index is not None
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._size -= size
+
+    async def get(self, key: str) -> Optional[File]:
+        """|coro|
+
+        Gets a cached image
+
+        Parameters
+        ----------
+        key: `str`
+            the key of the image
+
+        Returns
+        ----------
+        Optional[ciberedev.file.File]
+            the cached image, backed by a memory-mapped file. `None` if it is not cached
+        """
+
+        loop = asyncio.get_running_loop()
+        file = await loop.run_in_executor(None, self._get, key)
+        if file is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return file
+
+    async def set(self, key: str, file: File) -> None:
+        """|coro|
+
+        Caches an image
+
+        The image is written to a temporary file first, then moved into place, so a crash can never leave a partially written image in the cache.
+        Failing to write the image is logged instead of raised, since the cache is only an optimization.
+
+        Parameters
+        ----------
+        key: `str`
+            the key of the image
+        file: `ciberedev.file.File`
+            the image
+        """
+
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._set, key, file)
+        except OSError as e:
+            LOGGER.warning("Failed to write %r to the disk cache: %s", key, e)
+
+    async def clear(self) -> None:
+        """|coro|
+
+        Removes every cached image
+        """
+
+        def clear() -> None:
+            with self._lock:
+                index = self._load_index()
+                for key in list(index):
+                    _remove(self._filepath(key))
+                index.clear()
+                self._size = 0
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, clear)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import time
+from typing import Literal, Optional
+
+__all__ = ["CircuitBreaker"]
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    failure_threshold: int
+    recovery_timeout: float
+    state: CircuitState
+    failures: int
+    opened_at: Optional[float]
+
+    __slots__ = [
+        "failure_threshold",
+        "recovery_timeout",
+        "state",
+        "failures",
+        "opened_at",
+        "_trial_running",
+    ]
+
+    def __init__(self, *, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """Creates a circuit breaker, which stops the client from sending requests while the api is down
+
+        After `failure_threshold` consecutive failed requests (connection errors and 5xx status codes), the circuit opens,
+        and every request fails right away with `ciberedev.errors.CircuitOpen` instead of waiting on the api.
+        Every `recovery_timeout` seconds, the circuit goes half open and the api is pinged. If the ping succeeds,
+        the circuit closes and requests are sent again. Otherwise it opens again.
+
+        Parameters
+        ----------
+        failure_threshold: `int`
+            The amount of consecutive failures that open the circuit. Defaults to `5`
+        recovery_timeout: `float`
+            How long, in seconds, the circuit stays open before the api is pinged. Defaults to `30.0`
+
+        Attributes
+        ----------
+        failure_threshold: `int`
+            The amount of consecutive failures that open the circuit
+        recovery_timeout: `float`
+            How long, in seconds, the circuit stays open before the api is pinged
+        state: Literal['closed', 'open', 'half_open']
+            The current state of the circuit
+        failures: `int`
+            The amount of consecutive failures
+        opened_at: Optional[`float`]
+            The `time.monotonic` timestamp of when the circuit last opened
+        """
+
+        if failure_threshold < 1:
+            raise TypeError("failure_threshold must be atleast 1")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker state={self.state!r} failures={self.failures}>"
+
+    def allow_request(self) -> bool:
+        """Returns a bool depending on if a request can be sent or not
+
+        While the circuit is half open, only a single trial request is let through
+        """
+
+        if self.state == "closed":
+            return True
+        if self.state == "half_open" and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def half_open(self) -> None:
+        """Lets a single trial request through to check if the api is back up
+
+        If the circuit is already half open, the trial is let through again
+        """
+
+        if self.state != "closed":
+            self.state = "half_open"
+            self._trial_running = False
+
+    def release_trial(self) -> None:
+        """Lets another trial request through, after the last one ended without a success or failure being recorded. Ex: it was cancelled"""
+
+        if self.state == "half_open":
+            self._trial_running = False
+
+    def record_success(self) -> None:
+        """Records a successful request, closing the circuit"""
+
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+
+    def record_failure(self) -> bool:
+        """Records a failed request
+
+        Returns `True` if this failure opened the circuit
+        """
+
+        self.failures += 1
+        self._trial_running = False
+
+        if self.state == "half_open" or (
+            self.state == "closed" and self.failures >= self.failure_threshold
+        ):
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            return True
+
+        return False
@@ -1,45 +1,170 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from aiohttp import ClientSession
 
+from .cache import DiskCache, ResponseCache
+from .circuitbreaker import CircuitBreaker, CircuitState
+from .endpoints import LoadBalancer
 from .errors import ClientAlreadyClosed
-from .file import File
-from .http import HTTPClient
+from .file import File, StreamedFile
+from .http import DEFAULT_CHUNK_SIZE, HTTPClient
+from .metrics import Metrics
+from .pool import PoolConfig
+from .processing import ProcessingPool
+from .retries import RetryPolicy
 from .searching import SearchResult
+from .timeouts import Timeout
+from .tracing import (
+    HOOKS,
+    CacheHitEvent,
+    ImageDownloadedEvent,
+    OpenTelemetryTracer,
+    RequestEndEvent,
+    RequestStartEvent,
+    RetryEvent,
+)
+from .uploads import UploadSource
+from .urls import normalize_url
+from .utils import SingleFlight
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from .pipeline import Pipeline
+
 __all__ = ["Client"]
 
+T = TypeVar("T")
 LOGGER = logging.getLogger(__name__)
-URL_REGEX = re.compile(
-    r"^(?:http|ftp)s?://"
-    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|"
-    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
-    r"(?::\d+)?"
-    r"(?:/?|[/?]\S+)$",
-    re.IGNORECASE,
-)
+
+
+def _clean_screenshot_url(url: str, delay: int) -> str:
+    if delay > 20:
+        raise TypeError("Delay must be below 20")
+    if delay < 0:
+        raise TypeError("Delay can not be in the negatives")
+
+    return normalize_url(url, default_scheme="http")
+
+
+def _clean_text_color(
+    text_color: Optional[tuple[int, int, int]],
+) -> tuple[int, int, int]:
+    color = text_color or (
+        255,
+        255,
+        255,
+    )
+    for value in color:
+        if value > 255:
+            raise TypeError("Invalid color given")
+
+    return color
+
+
+def _add_image_param(params: dict[str, Any], fp: Union[str, UploadSource]) -> None:
+    if isinstance(fp, str):
+        params["url"] = normalize_url(fp)
+    elif isinstance(fp, File) and not fp.is_fetched():
+        # the api can download the image itself, so there is no need to fetch it first
+        params["url"] = fp.url
+    else:
+        params["image"] = fp
+
+
+def _is_cacheable(params: dict[str, Any]) -> bool:
+    # streamed uploads can't be hashed without reading them
+    return isinstance(params.get("image", b""), (bytes, bytearray, memoryview))
 
 
 class Client:
     _http: HTTPClient
+    _disk_cache: Optional[DiskCache]
+    _processing_pool: Optional[ProcessingPool]
+    _owns_processing_pool: bool
+    _inflight: Optional[SingleFlight[Any]]
     _started: bool
 
-    __slots__ = ["_http", "_started"]
+    __slots__ = [
+        "_http",
+        "_disk_cache",
+        "_processing_pool",
+        "_owns_processing_pool",
+        "_inflight",
+        "_started",
+    ]
 
-    def __init__(self, *, session: Optional[ClientSession] = None):
+    def __init__(
+        self,
+        *,
+        session: Optional[ClientSession] = None,
+        pool: Optional[PoolConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        coalesce_requests: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[CircuitBreaker, bool] = True,
+        timeout: Optional[Union[float, Timeout]] = None,
+        metrics: Optional[Metrics] = None,
+        tracer: Optional[OpenTelemetryTracer] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        processing_pool: Optional[ProcessingPool] = None,
+        base_url: Optional[Union[str, LoadBalancer]] = None,
+    ):
         """Lets you create a client instance
 
         Parameters
         ----------
         session: Optional[`aiohttp.ClientSession`]
-            an optional aiohttp client session that the internals will use for API calls
+            an optional aiohttp client session that the internals will use for API calls.
+            A trace config is added to it to time the client's requests, which ignores the session's other requests
+        pool: Optional[`ciberedev.pool.PoolConfig`]
+            the connection pool config for the session the client creates. Can not be used with `session`
+        cache: Optional[`ciberedev.cache.ResponseCache`]
+            an optional cache for the responses of `get_search_results`, `convert_image_to_ascii` and `ping`
+        disk_cache: Optional[`ciberedev.cache.DiskCache`]
+            an optional on-disk cache for the images returned by `take_screenshot`, `add_text_to_image`, `image_laugh` and `invert_image`
+        coalesce_requests: `bool`
+            Whether concurrent identical calls should share one request to the api. Every caller still gets its own result object.
+            This applies to every method except `get_random_words` and `ping`. Defaults to `True`
+        retry_policy: Optional[`ciberedev.retries.RetryPolicy`]
+            the policy that decides when and how failed requests are retried. Defaults to `ciberedev.retries.RetryPolicy()`
+        circuit_breaker: Union[`ciberedev.circuitbreaker.CircuitBreaker`, `bool`]
+            the circuit breaker that makes requests fail fast while the api is down. `True` uses `ciberedev.circuitbreaker.CircuitBreaker()`,
+            and `False` disables it. Defaults to `True`
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            the default timeout of every call. A float only overrides the total timeout. Defaults to `ciberedev.timeouts.Timeout()`
+        metrics: Optional[`ciberedev.metrics.Metrics`]
+            the store the client records its per-route request metrics in. Defaults to `ciberedev.metrics.Metrics()`
+        tracer: Optional[`ciberedev.tracing.OpenTelemetryTracer`]
+            an optional tracer, which turns the client's requests into OpenTelemetry spans
+        json_loads: Optional[Callable[[`bytes`], `Any`]]
+            the function the api's json responses are parsed with. It is given the raw response body.
+            Defaults to `orjson.loads` if orjson is installed, and `json.loads` otherwise
+        processing_pool: Optional[`ciberedev.processing.ProcessingPool`]
+            the worker processes the `process` functions of the image methods are ran in.
+            Defaults to a `ciberedev.processing.ProcessingPool()` that is created the first time one is used, and stopped when the client is closed
+        base_url: Optional[Union[`str`, `ciberedev.endpoints.LoadBalancer`]]
+            the base url of the api, such as a nearer mirror or a local proxy, or a load balancer that spreads requests over multiple mirrors.
+            Defaults to `'https://api.cibere.dev'`
 
         Attributes
         ----------
@@ -49,7 +174,34 @@ class Client:
             The amount of requests sent to the api during the programs lifetime
         """
 
-        self._http = HTTPClient(session=session, client=self)
+        if session is not None and pool is not None:
+            raise TypeError("pool can not be used with a custom session")
+
+        self._http = HTTPClient(
+            session=session,
+            client=self,
+            pool=pool,
+            cache=cache,
+            retry_policy=retry_policy,
+            circuit_breaker=(
+                CircuitBreaker() if circuit_breaker is True else circuit_breaker or None
+            ),
+            timeout=Timeout.resolve(timeout, Timeout()),
+            metrics=metrics,
+            hooks=[
+                name
+                for name in HOOKS
+                if getattr(type(self), f"on_{name}")
+                is not getattr(Client, f"on_{name}")
+            ],
+            tracer=tracer,
+            json_loads=json_loads,
+            base_url=base_url,
+        )
+        self._disk_cache = disk_cache
+        self._processing_pool = processing_pool
+        self._owns_processing_pool = processing_pool is None
+        self._inflight = SingleFlight() if coalesce_requests else None
         self._started = True
 
     @property
@@ -61,6 +213,76 @@ class Client:
 
         return self._http.latency
 
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """The response cache the client is using, if any"""
+
+        return self._http._cache
+
+    @property
+    def disk_cache(self) -> Optional[DiskCache]:
+        """The on-disk image cache the client is using, if any"""
+
+        return self._disk_cache
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """The retry policy the client is using"""
+
+        return self._http._retry_policy
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """The circuit breaker the client is using, if any"""
+
+        return self._http._circuit_breaker
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """The state of the client's circuit breaker.
+
+        This is `'open'` while the api is considered down and requests fail right away,
+        so you can use it to shed load instead of queueing requests. Always `'closed'` if the circuit breaker is disabled
+        """
+
+        breaker = self._http._circuit_breaker
+        return "closed" if breaker is None else breaker.state
+
+    @property
+    def timeout(self) -> Timeout:
+        """The default timeout of the client's calls"""
+
+        return self._http._timeout
+
+    @property
+    def metrics(self) -> Metrics:
+        """The per-route request metrics of the client, such as status codes, latency percentiles and bytes transferred.
+
+        Use `ciberedev.metrics.Metrics.snapshot` to read them, or `ciberedev.metrics.Metrics.to_prometheus` to export them
+        """
+
+        return self._http.metrics
+
+    @property
+    def base_url(self) -> str:
+        """The base url of the api. If the client has a load balancer, this is its first mirror"""
+
+        return self._http._base_url
+
+    @property
+    def load_balancer(self) -> Optional[LoadBalancer]:
+        """The load balancer the client is using, if any"""
+
+        return self._http._balancer
+
+    @property
+    def processing_pool(self) -> ProcessingPool:
+        """The worker processes the `process` functions of the image methods are ran in"""
+
+        if self._processing_pool is None:
+            self._processing_pool = ProcessingPool()
+        return self._processing_pool
+
     @property
     def requests(self) -> int:
         """The amount of requests sent to the api during the programs lifetime"""
@@ -79,6 +301,7 @@ class Client:
         return not self._started
 
     async def __aenter__(self) -> Self:
+        await self.prewarm()
         return self
 
     async def __aexit__(
@@ -91,6 +314,9 @@ class Client:
 
         This function is auto triggered when it hits a rate limit.
 
+        It is only triggered once per ratelimit, even if multiple requests to the same endpoint were ratelimited.
+        Requests to the endpoint are paused until the ratelimit resets, then automatically retried.
+
         When overriding this, you can call the super init if you still want the library to send the logs
 
         Parameters
@@ -100,9 +326,79 @@ class Client:
         """
 
         LOGGER.warning(
-            f"We are being ratelimited at '{endpoint}'. Trying again in 5 seconds"
+            f"We are being ratelimited at '{endpoint}'. Requests will be retried once the ratelimit resets"
         )
 
+    async def on_request_start(self, event: RequestStartEvent) -> None:
+        """|coro|
+
+        This function is auto triggered when a request to the api is sent, including retries.
+
+        Parameters
+        ----------
+        event: `ciberedev.tracing.RequestStartEvent`
+            the request
+        """
+
+    async def on_request_end(self, event: RequestEndEvent) -> None:
+        """|coro|
+
+        This function is auto triggered when a request to the api gets a response, or fails without one.
+
+        Parameters
+        ----------
+        event: `ciberedev.tracing.RequestEndEvent`
+            the request, its status code, and how long each phase of it took
+        """
+
+    async def on_retry(self, event: RetryEvent) -> None:
+        """|coro|
+
+        This function is auto triggered when a failed request is about to be retried.
+
+        Parameters
+        ----------
+        event: `ciberedev.tracing.RetryEvent`
+            the failed request, why it failed, and how long the client waits before retrying
+        """
+
+    async def on_cache_hit(self, event: CacheHitEvent) -> None:
+        """|coro|
+
+        This function is auto triggered when a call is answered from the response cache or the disk cache instead of the api.
+
+        Parameters
+        ----------
+        event: `ciberedev.tracing.CacheHitEvent`
+            the cache and the key that was hit
+        """
+
+    async def on_image_downloaded(self, event: ImageDownloadedEvent) -> None:
+        """|coro|
+
+        This function is auto triggered when an image has been downloaded, or a `ciberedev.file.StreamedFile` has been fully streamed.
+
+        Parameters
+        ----------
+        event: `ciberedev.tracing.ImageDownloadedEvent`
+            the image's url, size, and how long the download took
+        """
+
+    async def prewarm(self, connections: Optional[int] = None) -> None:
+        """|coro|
+
+        Opens connections to the api ahead of time, so the first requests don't have to.
+
+        This is automatically called with `ciberedev.pool.PoolConfig.prewarm` connections when the client is used as a context manager
+
+        Parameters
+        ----------
+        connections: Optional[`int`]
+            the amount of connections to open. Defaults to `ciberedev.pool.PoolConfig.prewarm`
+        """
+
+        await self._http.prewarm(connections)
+
     async def close(self) -> None:
         """|coro|
 
@@ -117,10 +413,128 @@ class Client:
         if not self._started:
             raise ClientAlreadyClosed()
 
-        if self._http._session:
-            await self._http._session.close()
+        if self._owns_processing_pool and self._processing_pool is not None:
+            self._processing_pool.close(wait=False)
+            self._processing_pool = None
+
+        await self._http.close()
+
+    async def _file_from_link(
+        self, link: str, stream: bool, fetch: bool
+    ) -> Union[File, StreamedFile]:
+        if stream:
+            return StreamedFile(
+                url=link, http=self._http, chunk_size=DEFAULT_CHUNK_SIZE
+            )
+        if not fetch:
+            return File._from_url(link, self._http)
+
+        fp = await self._http.get_image_from_url(link)
+        return File(raw_bytes=fp, url=link)
+
+    async def _coalesce(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        if self._inflight is None:
+            return await func()
+        return await self._inflight.do(key, func)
+
+    async def _get_image(
+        self,
+        method: str,
+        params: dict[str, Any],
+        request: Callable[[], Awaitable[Any]],
+        stream: bool,
+        fetch: bool,
+        process: Optional[Callable[[memoryview], Any]] = None,
+    ) -> Union[File, StreamedFile]:
+        if process is not None and (stream or not fetch):
+            raise TypeError("process can not be used with stream or fetch=False")
+
+        key = (method, tuple(sorted(params.items())), stream, fetch)
+        try:
+            hash(key)
+        except TypeError:
+            # uploads from mutable buffers can't be matched with other calls
+            file = await self._load_image(method, params, request, stream, fetch)
+        else:
+            file = await self._coalesce(
+                key, lambda: self._load_image(method, params, request, stream, fetch)
+            )
+            # the file might be shared with other callers, so everyone gets their own copy
+            file = file._copy()
+
+        if process is not None:
+            file.processed = await self.processing_pool.process(file, process)  # type: ignore
+
+        return file
 
-    async def take_screenshot(self, url: str, /, *, delay: int = 0) -> File:
+    async def _load_image(
+        self,
+        method: str,
+        params: dict[str, Any],
+        request: Callable[[], Awaitable[Any]],
+        stream: bool,
+        fetch: bool,
+    ) -> Union[File, StreamedFile]:
+        cache = self._disk_cache
+        if cache is None or stream or not fetch or not _is_cacheable(params):
+            data = await request()
+            return await self._file_from_link(data["link"], stream, fetch)
+
+        key = cache.make_key(method, **params)
+        file = await cache.get(key)
+        if file is not None:
+            self._http.dispatch(
+                "cache_hit", CacheHitEvent(cache="disk", name=method, key=key)
+            )
+            return file
+
+        data = await request()
+        file = File(
+            raw_bytes=await self._http.get_image_from_url(data["link"]),
+            url=data["link"],
+        )
+        await cache.set(key, file)
+        return file
+
+    @overload
+    async def take_screenshot(
+        self,
+        url: str,
+        /,
+        *,
+        delay: int = ...,
+        fetch: bool = ...,
+        stream: Literal[False] = ...,
+        process: Optional[Callable[[memoryview], Any]] = ...,
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> File: ...
+
+    @overload
+    async def take_screenshot(
+        self,
+        url: str,
+        /,
+        *,
+        delay: int = ...,
+        fetch: bool = ...,
+        stream: Literal[True],
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> StreamedFile: ...
+
+    async def take_screenshot(
+        self,
+        url: str,
+        /,
+        *,
+        delay: int = 0,
+        fetch: bool = True,
+        stream: bool = False,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Union[File, StreamedFile]:
         """|coro|
 
         Takes a screenshot of the given url
@@ -131,6 +545,17 @@ class Client:
             The url you want to be screenshotted
         delay: Optional[`int`]
             The delay between going to the website, and taking the screenshot
+        fetch: `bool`
+            Whether to download the screenshot right away. If `False`, it is only downloaded once `ciberedev.file.File.read` is called. Defaults to `True`
+        stream: `bool`
+            Whether to return a `ciberedev.file.StreamedFile` instead of downloading the screenshot into memory. Defaults to `False`
+        process: Optional[Callable[[`memoryview`], `Any`]]
+            A function that is ran on the image's bytes in a worker process, whose result is stored in `ciberedev.file.File.processed`.
+            See `ciberedev.processing.ProcessingPool.process`. Can not be used with `stream` or `fetch=False`
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of this call. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp this call has to finish by. Defaults to no deadline
 
 
         Raises
@@ -143,33 +568,140 @@ class Client:
             The api has returned an unknown error
         APIOffline
             I could not connect to the api
+        RequestTimedOut
+            The call did not finish before its timeout or deadline
 
         Returns
         ----------
-        ciberedev.file.File
+        Union[ciberedev.file.File, ciberedev.file.StreamedFile]
             A file object of your screenshot
         """
 
-        url = url.removeprefix("<").removesuffix(">")
+        url = _clean_screenshot_url(url, delay)
+
+        return await self._http.with_timeout(
+            self._get_image(
+                "take_screenshot",
+                {"url": url, "delay": delay},
+                lambda: self._http.take_screenshot(url, delay),
+                stream,
+                fetch,
+                process,
+            ),
+            timeout,
+            deadline,
+        )
 
-        if not url.startswith("http"):
-            url = f"http://{url}"
-        if delay > 20:
-            raise TypeError("Delay must be below 20")
-        if delay < 0:
-            raise TypeError("Delay can not be in the negatives")
-        if not re.match(URL_REGEX, url):
-            raise TypeError("Invalid URL Given")
+    async def take_screenshots(
+        self,
+        urls: Union[Iterable[str], AsyncIterable[str]],
+        /,
+        *,
+        delay: int = 0,
+        concurrency: int = 8,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[tuple[str, Union[File, Exception]]]:
+        """Takes a screenshot of each of the given urls
 
-        data = await self._http.take_screenshot(url, delay)
-        link = data["link"]
-        fp = await self._http.get_image_from_url(link)
+        At most `concurrency` screenshots are taken at once, and the urls are only pulled from `urls` as workers free up,
+        so memory usage stays flat no matter how many urls are given. Requests still go through the client's ratelimiting.
 
-        file = File(raw_bytes=fp, url=link)
-        return file
+        Parameters
+        ----------
+        urls: Union[Iterable[`str`], AsyncIterable[`str`]]
+            The urls you want to be screenshotted
+        delay: Optional[`int`]
+            The delay between going to the website, and taking the screenshot
+        concurrency: Optional[`int`]
+            The max amount of screenshots being taken at once. Defaults to 8
+        process: Optional[Callable[[`memoryview`], `Any`]]
+            A function that is ran on each screenshot's bytes in a worker process, whose result is stored in `ciberedev.file.File.processed`.
+            See `ciberedev.processing.ProcessingPool.process`
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of each screenshot. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp every screenshot has to finish by. Screenshots that do not finish in time are yielded with a `ciberedev.errors.RequestTimedOut` error. Defaults to no deadline
+
+        Raises
+        ----------
+        TypeError
+            concurrency is below 1
+
+        Yields
+        ----------
+        tuple[`str`, Union[ciberedev.file.File, `Exception`]]
+            The url, and either a file object of its screenshot or the error raised while taking it, in the order they complete
+        """
+
+        if concurrency < 1:
+            raise TypeError("Concurrency must be atleast 1")
+
+        pending: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=concurrency)
+        results: asyncio.Queue[Optional[tuple[str, Union[File, Exception]]]] = (
+            asyncio.Queue(maxsize=concurrency)
+        )
+
+        async def stop_workers() -> None:
+            for _ in range(concurrency):
+                await pending.put(None)
+
+        async def feed() -> None:
+            try:
+                if isinstance(urls, AsyncIterable):
+                    async for url in urls:
+                        await pending.put(url)
+                else:
+                    for url in urls:
+                        await pending.put(url)
+            except Exception:
+                await stop_workers()
+                raise
+
+            await stop_workers()
+
+        async def work() -> None:
+            while (url := await pending.get()) is not None:
+                try:
+                    result = await self.take_screenshot(
+                        url,
+                        delay=delay,
+                        process=process,
+                        timeout=timeout,
+                        deadline=deadline,
+                    )
+                except Exception as e:
+                    result = e
+                await results.put((url, result))
+
+            await results.put(None)
+
+        feeder = asyncio.create_task(feed())
+        workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+
+        try:
+            finished = 0
+            while finished < concurrency:
+                item = await results.get()
+                if item is None:
+                    finished += 1
+                else:
+                    yield item
+
+            await feeder
+        finally:
+            for task in (feeder, *workers):
+                task.cancel()
 
     async def get_search_results(
-        self, query: str, /, *, amount: int = 5
+        self,
+        query: str,
+        /,
+        *,
+        amount: int = 5,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
     ) -> list[SearchResult]:
         """|coro|
 
@@ -181,6 +713,10 @@ class Client:
             The query of your search
         amount: Optional[`int`]
             The amount of results you want. Defaults to 5
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of this call. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp this call has to finish by. Defaults to no deadline
 
         Raises
         ----------
@@ -188,6 +724,8 @@ class Client:
             The api has returned an unknown error
         APIOffline
             I could not connect to the api
+        RequestTimedOut
+            The call did not finish before its timeout or deadline
 
         Returns
         ----------
@@ -195,7 +733,14 @@ class Client:
             A list of your search results
         """
 
-        data = await self._http.get_search_results(query, amount)
+        data = await self._http.with_timeout(
+            self._coalesce(
+                ("get_search_results", query, amount),
+                lambda: self._http.get_search_results(query, amount),
+            ),
+            timeout,
+            deadline,
+        )
 
         final = []
         for raw_result in data["results"]:
@@ -204,7 +749,94 @@ class Client:
 
         return final
 
-    async def get_random_words(self, amount: int, /) -> list[str]:
+    async def iter_search_results(
+        self,
+        query: str,
+        /,
+        *,
+        limit: Optional[int] = None,
+        page_size: int = 10,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[SearchResult]:
+        """Searches the web with the given query, yielding the results as they arrive
+
+        The api can not skip results, so each request asks for twice as many results as the previous one,
+        and only the new ones are yielded. The next request is sent while the current results are being consumed,
+        and stopping early means the remaining results are never requested.
+
+        Parameters
+        ----------
+        query: `str`
+            The query of your search
+        limit: Optional[`int`]
+            The max amount of results. Defaults to every result the api gives
+        page_size: `int`
+            The amount of results the first request asks for. Defaults to 10
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of each request. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp every request has to finish by. Defaults to no deadline
+
+        Raises
+        ----------
+        TypeError
+            limit or page_size is below 1
+        UnknownError
+            The api has returned an unknown error
+        APIOffline
+            I could not connect to the api
+        RequestTimedOut
+            A request did not finish before its timeout or deadline
+
+        Yields
+        ----------
+        ciberedev.searching.SearchResult
+            The next search result
+        """
+
+        if page_size < 1:
+            raise TypeError("page_size must be atleast 1")
+        if limit is not None and limit < 1:
+            raise TypeError("limit must be atleast 1")
+
+        def fetch(amount: int) -> asyncio.Task[list[SearchResult]]:
+            return asyncio.create_task(
+                self.get_search_results(
+                    query, amount=amount, timeout=timeout, deadline=deadline
+                )
+            )
+
+        amount = page_size if limit is None else min(page_size, limit)
+        task: Optional[asyncio.Task[list[SearchResult]]] = fetch(amount)
+        yielded = 0
+
+        try:
+            while task is not None:
+                results = await task
+
+                # fewer results than asked for means the api ran out
+                if len(results) < amount or amount == limit:
+                    task = None
+                else:
+                    amount = amount * 2 if limit is None else min(amount * 2, limit)
+                    task = fetch(amount)
+
+                for result in results[yielded:]:
+                    yield result
+                yielded = max(yielded, len(results))
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def get_random_words(
+        self,
+        amount: int,
+        /,
+        *,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> list[str]:
         """|coro|
 
         Gives you random words
@@ -213,6 +845,10 @@ class Client:
         ----------
         amount: `int`
             the amount of random words you want
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of this call. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp this call has to finish by. Defaults to no deadline
 
         Raises
         ----------
@@ -220,6 +856,8 @@ class Client:
             The api has returned an unknown error
         APIOffline
             I could not connect to the api
+        RequestTimedOut
+            The call did not finish before its timeout or deadline
 
         Returns
         ----------
@@ -227,11 +865,19 @@ class Client:
             the random words that have been generated
         """
 
-        data = await self._http.get_random_words(amount)
+        data = await self._http.with_timeout(
+            self._http.get_random_words(amount), timeout, deadline
+        )
         return data["words"]
 
     async def convert_image_to_ascii(
-        self, url: str, /, *, width: Optional[int] = None
+        self,
+        url: str,
+        /,
+        *,
+        width: Optional[int] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
     ) -> str:
         """|coro|
 
@@ -243,6 +889,10 @@ class Client:
             the images url
         width: Optional[`int`]
             the ascii arts width
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of this call. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp this call has to finish by. Defaults to no deadline
 
         Raises
         ----------
@@ -250,26 +900,66 @@ class Client:
             The api has returned an unknown error
         APIOffline
             I could not connect to the api
+        RequestTimedOut
+            The call did not finish before its timeout or deadline
 
         Returns
         ----------
         str
             the ascii art"""
 
-        if not re.match(URL_REGEX, url):
-            raise TypeError("Invalid URL Given")
+        url = normalize_url(url)
 
-        data = await self._http.convert_image_to_ascii(url, width)
+        data = await self._http.with_timeout(
+            self._coalesce(
+                ("convert_image_to_ascii", url, width),
+                lambda: self._http.convert_image_to_ascii(url, width),
+            ),
+            timeout,
+            deadline,
+        )
         art = data["msg"]
         return art
 
+    @overload
+    async def add_text_to_image(
+        self,
+        *,
+        image_url: str,
+        text: str,
+        text_color: Optional[tuple[int, int, int]] = ...,
+        fetch: bool = ...,
+        stream: Literal[False] = ...,
+        process: Optional[Callable[[memoryview], Any]] = ...,
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> File: ...
+
+    @overload
+    async def add_text_to_image(
+        self,
+        *,
+        image_url: str,
+        text: str,
+        text_color: Optional[tuple[int, int, int]] = ...,
+        fetch: bool = ...,
+        stream: Literal[True],
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> StreamedFile: ...
+
     async def add_text_to_image(
         self,
         *,
         image_url: str,
         text: str,
         text_color: Optional[tuple[int, int, int]] = None,
-    ) -> File:
+        fetch: bool = True,
+        stream: bool = False,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Union[File, StreamedFile]:
         """|coro|
 
         Adds text to a given image
@@ -282,6 +972,17 @@ class Client:
             the text to be added
         text_color: tuple[`int`, `int`, `int`]
             the color to be added to the text
+        fetch: `bool`
+            Whether to download the image right away. If `False`, it is only downloaded once `ciberedev.file.File.read` is called. Defaults to `True`
+        stream: `bool`
+            Whether to return a `ciberedev.file.StreamedFile` instead of downloading the image into memory. Defaults to `False`
+        process: Optional[Callable[[`memoryview`], `Any`]]
+            A function that is ran on the image's bytes in a worker process, whose result is stored in `ciberedev.file.File.processed`.
+            See `ciberedev.processing.ProcessingPool.process`. Can not be used with `stream` or `fetch=False`
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of this call. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp this call has to finish by. Defaults to no deadline
 
         Raises
         ----------
@@ -289,44 +990,92 @@ class Client:
             The api has returned an unknown error
         APIOffline
             I could not connect to the api
+        RequestTimedOut
+            The call did not finish before its timeout or deadline
 
         Returns
         ----------
-        ciberedev.file.File
+        Union[ciberedev.file.File, ciberedev.file.StreamedFile]
             A file with the new image
         """
 
-        color = text_color or (
-            255,
-            255,
-            255,
+        image_url = normalize_url(image_url)
+        color = _clean_text_color(text_color)
+
+        return await self._http.with_timeout(
+            self._get_image(
+                "add_text_to_image",
+                {"url": image_url, "text": text, "color": color},
+                lambda: self._http.add_text_to_image(image_url, text, color),
+                stream,
+                fetch,
+                process,
+            ),
+            timeout,
+            deadline,
         )
-        if not re.match(URL_REGEX, image_url):
-            raise TypeError("Invalid URL Given")
-        for value in color:
-            if value > 255:
-                raise TypeError("Invalid color given")
-
-        data = await self._http.add_text_to_image(image_url, text, color)
-        url = data["link"]
-        fp = await self._http.get_image_from_url(url)
 
-        file = File(raw_bytes=fp, url=url)
-        return file
+    @overload
+    async def image_laugh(
+        self,
+        fp: Union[str, UploadSource],
+        /,
+        *,
+        style: Optional[Literal[1, 2]] = ...,
+        fetch: bool = ...,
+        stream: Literal[False] = ...,
+        process: Optional[Callable[[memoryview], Any]] = ...,
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> File: ...
+
+    @overload
+    async def image_laugh(
+        self,
+        fp: Union[str, UploadSource],
+        /,
+        *,
+        style: Optional[Literal[1, 2]] = ...,
+        fetch: bool = ...,
+        stream: Literal[True],
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> StreamedFile: ...
 
     async def image_laugh(
-        self, fp: Union[str, bytes], /, *, style: Optional[Literal[1, 2]] = None
-    ) -> File:
+        self,
+        fp: Union[str, UploadSource],
+        /,
+        *,
+        style: Optional[Literal[1, 2]] = None,
+        fetch: bool = True,
+        stream: bool = False,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Union[File, StreamedFile]:
         """|coro|
 
         makes an image that laughs at the given image
 
         Parameters
         ----------
-        fp : `Union[str, bytes]`
-            the url or bytes of the image
+        fp : Union[`str`, `bytes`, `os.PathLike`, `BinaryIO`, AsyncIterable[`bytes`], `ciberedev.file.File`]
+            the url of the image, or the image itself. Paths, file objects and async iterables are streamed to the api
+            instead of being read into memory. File objects are only retried if they are seekable, and async iterables are never retried
         style : `Literal[1, 2]`
             the style of laugh
+        fetch: `bool`
+            Whether to download the image right away. If `False`, it is only downloaded once `ciberedev.file.File.read` is called. Defaults to `True`
+        stream: `bool`
+            Whether to return a `ciberedev.file.StreamedFile` instead of downloading the image into memory. Defaults to `False`
+        process: Optional[Callable[[`memoryview`], `Any`]]
+            A function that is ran on the image's bytes in a worker process, whose result is stored in `ciberedev.file.File.processed`.
+            See `ciberedev.processing.ProcessingPool.process`. Can not be used with `stream` or `fetch=False`
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of this call. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp this call has to finish by. Defaults to no deadline
 
         Raises
         ----------
@@ -334,36 +1083,88 @@ class Client:
             The api has returned an unknown error
         APIOffline
             I could not connect to the api
+        RequestTimedOut
+            The call did not finish before its timeout or deadline
 
         Returns
         ----------
-        ciberedev.file.File
+        Union[ciberedev.file.File, ciberedev.file.StreamedFile]
             A file with the new image
         """
 
         kwargs: dict[str, Any] = {"style": style or 2}
 
-        if isinstance(fp, bytes):
-            kwargs["bytes"] = fp
-        else:
-            kwargs["url"] = fp
-
-        data = await self._http.image_laugh(**kwargs)
-        url = data["link"]
-        fp = await self._http.get_image_from_url(url)
+        _add_image_param(kwargs, fp)
+
+        return await self._http.with_timeout(
+            self._get_image(
+                "image_laugh",
+                kwargs,
+                lambda: self._http.image_laugh(**kwargs),
+                stream,
+                fetch,
+                process,
+            ),
+            timeout,
+            deadline,
+        )
 
-        file = File(raw_bytes=fp, url=url)
-        return file
+    @overload
+    async def invert_image(
+        self,
+        fp: Union[str, UploadSource],
+        /,
+        *,
+        fetch: bool = ...,
+        stream: Literal[False] = ...,
+        process: Optional[Callable[[memoryview], Any]] = ...,
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> File: ...
+
+    @overload
+    async def invert_image(
+        self,
+        fp: Union[str, UploadSource],
+        /,
+        *,
+        fetch: bool = ...,
+        stream: Literal[True],
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> StreamedFile: ...
 
-    async def invert_image(self, fp: Union[str, bytes], /) -> File:
+    async def invert_image(
+        self,
+        fp: Union[str, UploadSource],
+        /,
+        *,
+        fetch: bool = True,
+        stream: bool = False,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Union[File, StreamedFile]:
         """|coro|
 
         inverts an image
 
         Parameters
         ----------
-        fp : `Union[str, bytes]`
-            the url or bytes of the image
+        fp : Union[`str`, `bytes`, `os.PathLike`, `BinaryIO`, AsyncIterable[`bytes`], `ciberedev.file.File`]
+            the url of the image, or the image itself. Paths, file objects and async iterables are streamed to the api
+            instead of being read into memory. File objects are only retried if they are seekable, and async iterables are never retried
+        fetch: `bool`
+            Whether to download the image right away. If `False`, it is only downloaded once `ciberedev.file.File.read` is called. Defaults to `True`
+        stream: `bool`
+            Whether to return a `ciberedev.file.StreamedFile` instead of downloading the image into memory. Defaults to `False`
+        process: Optional[Callable[[`memoryview`], `Any`]]
+            A function that is ran on the image's bytes in a worker process, whose result is stored in `ciberedev.file.File.processed`.
+            See `ciberedev.processing.ProcessingPool.process`. Can not be used with `stream` or `fetch=False`
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of this call. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp this call has to finish by. Defaults to no deadline
 
         Raises
         ----------
@@ -371,38 +1172,81 @@ class Client:
             The api has returned an unknown error
         APIOffline
             I could not connect to the api
+        RequestTimedOut
+            The call did not finish before its timeout or deadline
 
         Returns
         ----------
-        ciberedev.file.File
+        Union[ciberedev.file.File, ciberedev.file.StreamedFile]
             A file with the new image
         """
 
         kwargs: dict[str, Any] = {}
 
-        if isinstance(fp, bytes):
-            kwargs["bytes"] = fp
-        else:
-            kwargs["url"] = fp
+        _add_image_param(kwargs, fp)
+
+        return await self._http.with_timeout(
+            self._get_image(
+                "invert_image",
+                kwargs,
+                lambda: self._http.invert_image(**kwargs),
+                stream,
+                fetch,
+                process,
+            ),
+            timeout,
+            deadline,
+        )
 
-        data = await self._http.invert_image(**kwargs)
-        url = data["link"]
-        fp = await self._http.get_image_from_url(url)
+    def pipeline(self, fp: Optional[Union[str, UploadSource]] = None, /) -> Pipeline:
+        """Creates a pipeline, which chains image transforms without downloading the images in between
 
-        file = File(raw_bytes=fp, url=url)
-        return file
+        Each step is given the url of the previous step's image, so the api fetches it itself,
+        and only the final image is downloaded. Ex: `await client.pipeline().take_screenshot("www.google.com").invert_image().run()`
+
+        Parameters
+        ----------
+        fp: Optional[Union[`str`, `bytes`, `os.PathLike`, `BinaryIO`, AsyncIterable[`bytes`], `ciberedev.file.File`]]
+            the url of the image the pipeline starts with, or the image itself. If not given, the pipeline has to start with `take_screenshot`
+
+        Returns
+        ----------
+        ciberedev.pipeline.Pipeline
+            the pipeline
+        """
+
+        from .pipeline import Pipeline
+
+        return Pipeline(self, fp)
 
-    async def ping(self) -> float:
+    async def ping(
+        self,
+        *,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> float:
         """|coro|
 
         Pings the api
 
+        If the client has a load balancer, every mirror is pinged and the lowest latency is returned.
+        The latency strategy of `ciberedev.endpoints.LoadBalancer` relies on these pings
+
+        Parameters
+        ----------
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of this call. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp this call has to finish by. Defaults to no deadline
+
         Raises
         ----------
         UnknownError
             The api has returned an unknown error
         APIOffline
             I could not connect to the api
+        RequestTimedOut
+            The call did not finish before its timeout or deadline
 
         Returns
         ----------
@@ -410,4 +1254,4 @@ class Client:
             the latency. Multiply by 1000 to convert to ms
         """
 
-        return await self._http.ping()
+        return await self._http.with_timeout(self._http.ping(), timeout, deadline)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import Iterable, Literal, Optional
+
+__all__ = ["Endpoint", "LoadBalancer"]
+
+BalancingStrategy = Literal["round_robin", "least_outstanding", "latency"]
+STRATEGIES = ("round_robin", "least_outstanding", "latency")
+LATENCY_SMOOTHING = 0.3
+
+
+class Endpoint:
+    url: str
+    outstanding: int
+    latency: Optional[float]
+    failures: int
+    ejected_until: Optional[float]
+
+    __slots__ = ["url", "outstanding", "latency", "failures", "ejected_until"]
+
+    def __init__(self, url: str):
+        """An api mirror a load balancer sends requests to. You should not be creating these yourself
+
+        Attributes
+        ----------
+        url: `str`
+            the base url of the mirror. Ex: 'https://api.cibere.dev'
+        outstanding: `int`
+            The amount of requests currently being sent to the mirror
+        latency: Optional[`float`]
+            The smoothed latency of the mirror's pings, in seconds. `None` until it has been pinged
+        failures: `int`
+            The amount of consecutive failed requests (connection errors and 5xx status codes)
+        ejected_until: Optional[`float`]
+            The `time.monotonic` timestamp the mirror is ejected until, if it is ejected
+        """
+
+        self.url = url.rstrip("/")
+        self.outstanding = 0
+        self.latency = None
+        self.failures = 0
+        self.ejected_until = None
+
+    def __repr__(self) -> str:
+        return f"<Endpoint url={self.url!r} outstanding={self.outstanding} latency={self.latency} healthy={self.is_healthy()}>"
+
+    def is_healthy(self) -> bool:
+        """Returns a bool depending on if the mirror is receiving requests or not
+
+        Returns
+        ----------
+        bool
+            False while the mirror is ejected, True otherwise
+        """
+
+        return self.ejected_until is None or self.ejected_until <= time.monotonic()
+
+
+class LoadBalancer:
+    endpoints: list[Endpoint]
+    strategy: BalancingStrategy
+    failure_threshold: int
+    ejection_time: float
+
+    __slots__ = [
+        "endpoints",
+        "strategy",
+        "failure_threshold",
+        "ejection_time",
+        "_next",
+        "_random",
+    ]
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        /,
+        *,
+        strategy: BalancingStrategy = "round_robin",
+        failure_threshold: int = 3,
+        ejection_time: float = 30.0,
+    ):
+        """Creates a load balancer, which spreads the client's requests over multiple api mirrors
+
+        After `failure_threshold` consecutive failed requests (connection errors and 5xx status codes), a mirror is ejected,
+        and does not receive requests for `ejection_time` seconds. If every mirror is ejected, the one whose ejection ends first is used.
+        Retries pick a mirror again, so a retried request usually goes to a different mirror.
+
+        Parameters
+        ----------
+        urls: Iterable[`str`]
+            the base urls of the mirrors. Ex: `['https://api.cibere.dev', 'https://eu.example.com']`
+        strategy: Literal['round_robin', 'least_outstanding', 'latency']
+            How a mirror is picked for each request. `'round_robin'` takes turns, `'least_outstanding'` picks the mirror with the least requests
+            being sent to it, and `'latency'` picks mirrors at random, weighted by how fast their pings are. Defaults to `'round_robin'`
+        failure_threshold: `int`
+            The amount of consecutive failures that eject a mirror. Defaults to `3`
+        ejection_time: `float`
+            How long, in seconds, a mirror is ejected for. Defaults to `30.0`
+
+        Attributes
+        ----------
+        endpoints: list[`ciberedev.endpoints.Endpoint`]
+            The mirrors
+        strategy: Literal['round_robin', 'least_outstanding', 'latency']
+            How a mirror is picked for each request
+        failure_threshold: `int`
+            The amount of consecutive failures that eject a mirror
+        ejection_time: `float`
+            How long, in seconds, a mirror is ejected for
+        """
+
+        if strategy not in STRATEGIES:
+            raise TypeError(f"strategy must be one of {', '.join(STRATEGIES)}")
+        if failure_threshold < 1:
+            raise TypeError("failure_threshold must be atleast 1")
+
+        self.endpoints = [Endpoint(url) for url in urls]
+        if not self.endpoints:
+            raise TypeError("urls can not be empty")
+
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self._next = 0
+        self._random = random.Random()
+
+    def __repr__(self) -> str:
+        return (
+            f"<LoadBalancer strategy={self.strategy!r} endpoints={len(self.endpoints)}>"
+        )
+
+    def pick(self) -> Endpoint:
+        """Picks the mirror the next request is sent to
+
+        Returns
+        ----------
+        ciberedev.endpoints.Endpoint
+            the mirror
+        """
+
+        candidates = [endpoint for endpoint in self.endpoints if endpoint.is_healthy()]
+        if not candidates:
+            return min(
+                self.endpoints, key=lambda endpoint: endpoint.ejected_until or 0.0
+            )
+
+        if self.strategy == "latency":
+            known = [e.latency for e in candidates if e.latency is not None]
+            if known:
+                # mirrors that have not been pinged yet are given the best latency, so they still get tried
+                best = max(min(known), 1e-6)
+                weights = [1 / max(e.latency or best, 1e-6) for e in candidates]
+                return self._random.choices(candidates, weights)[0]
+
+        start = self._next % len(candidates)
+        self._next += 1
+
+        if self.strategy == "least_outstanding":
+            # rotating the candidates first spreads ties out evenly
+            rotated = candidates[start:] + candidates[:start]
+            return min(rotated, key=lambda endpoint: endpoint.outstanding)
+
+        return candidates[start]
+
+    def record_success(self, endpoint: Endpoint, /) -> None:
+        """Records a successful request to a mirror"""
+
+        endpoint.failures = 0
+        endpoint.ejected_until = None
+
+    def record_failure(self, endpoint: Endpoint, /) -> bool:
+        """Records a failed request to a mirror
+
+        Returns `True` if this failure ejected the mirror
+        """
+
+        endpoint.failures += 1
+        if endpoint.failures < self.failure_threshold or not endpoint.is_healthy():
+            return False
+
+        # a single failure after the ejection ends ejects the mirror again
+        endpoint.failures = self.failure_threshold - 1
+        endpoint.ejected_until = time.monotonic() + self.ejection_time
+        return True
+
+    def record_latency(self, endpoint: Endpoint, latency: float, /) -> None:
+        """Records the latency of a ping to a mirror"""
+
+        if endpoint.latency is None:
+            endpoint.latency = latency
+        else:
+            endpoint.latency += LATENCY_SMOOTHING * (latency - endpoint.latency)
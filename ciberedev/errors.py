@@ -1,10 +1,17 @@
+import asyncio
+from typing import Optional
+
 __all__ = [
     "ClientAlreadyClosed",
     "APIOffline",
+    "CircuitOpen",
+    "RequestTimedOut",
     "UnknownDataReturned",
     "HTTPException",
     "UnknownStatusCode",
     "InternalServerError",
+    "FileNotFetched",
+    "NotEnoughWords",
 ]
 
 
@@ -92,6 +99,57 @@ class APIOffline(HTTPException):
         super().__init__(f"API is down. Aborting API request to '{endpoint}'")
 
 
+class CircuitOpen(APIOffline):
+    def __init__(self, endpoint: str):
+        """Creates a CircuitOpen error instance.
+
+        This is raised instead of sending a request while the client's circuit breaker is open,
+        which happens when the api has failed too many times in a row
+        It is not recommended to raise this yourself
+
+        Parameters
+        ----------
+        endpoint: `str`
+            the endpoint the client is trying to make a request to
+
+        Attributes
+        ----------
+        endpoint: `str`
+            the endpoint the client is trying to make a request to
+        """
+
+        self.endpoint = endpoint
+        HTTPException.__init__(
+            self,
+            f"API is down and the circuit breaker is open. Aborting API request to '{endpoint}'",
+        )
+
+
+class RequestTimedOut(HTTPException, asyncio.TimeoutError):
+    def __init__(self, endpoint: Optional[str] = None):
+        """Creates a RequestTimedOut error instance.
+
+        This is raised when a method call takes longer than its timeout or deadline allows
+        It is not recommended to raise this yourself
+
+        Parameters
+        ----------
+        endpoint: Optional[`str`]
+            the endpoint the client was making a request to, if it is known
+
+        Attributes
+        ----------
+        endpoint: Optional[`str`]
+            the endpoint the client was making a request to, if it is known
+        """
+
+        self.endpoint = endpoint
+        if endpoint is None:
+            super().__init__("Request timed out")
+        else:
+            super().__init__(f"Request to '{endpoint}' timed out")
+
+
 class ClientAlreadyClosed(CiberedevException):
     def __init__(self):
         """Creates a ClientAlreadyClosed error instance.
@@ -110,3 +168,56 @@ class InternalServerError(CiberedevException):
 
         It is not recommended to raise this yourself"""
         super().__init__("We have run out of attempts, aborting request")
+
+
+class FileNotFetched(CiberedevException):
+    def __init__(self, url: str):
+        """Creates a FileNotFetched error instance
+
+        This is raised when accessing the bytes of a file that has not been downloaded yet
+        It is not recommended to raise this yourself
+
+        Parameters
+        ----------
+        url: `str`
+            the url of the file
+
+        Attributes
+        ----------
+        url: `str`
+            the url of the file
+        """
+
+        self.url = url
+        super().__init__(
+            f"The file at '{url}' has not been fetched yet. Fetch it with 'await File.read()'"
+        )
+
+
+class NotEnoughWords(CiberedevException):
+    def __init__(self, requested: int, available: int):
+        """Creates a NotEnoughWords error instance
+
+        This is raised when taking more words from a `ciberedev.words.RandomWordPool` than it has buffered, or when the api gives it no more words
+        It is not recommended to raise this yourself
+
+        Parameters
+        ----------
+        requested: `int`
+            the amount of words that were requested
+        available: `int`
+            the amount of words the pool had
+
+        Attributes
+        ----------
+        requested: `int`
+            the amount of words that were requested
+        available: `int`
+            the amount of words the pool had
+        """
+
+        self.requested = requested
+        self.available = available
+        super().__init__(
+            f"{requested} words were requested, but the pool only has {available}"
+        )
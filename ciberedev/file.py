@@ -1,23 +1,116 @@
+from __future__ import annotations
+
 import asyncio
+import os
+import shutil
+import tempfile
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
 from functools import partial as partial_func
-from typing import Any, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .errors import FileNotFetched
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
 
-__all__ = ["File"]
+__all__ = ["File", "StreamedFile", "save_many"]
 
+WRITE_CHUNK_SIZE = 1024 * 1024
+PathType = Union[str, "os.PathLike[str]"]
 
-def _write_to_file(filepath: str, data: Any) -> None:
+
+def _write_to_file(filepath: PathType, data: memoryview) -> None:
     with open(filepath, "wb") as f:
-        f.write(data)
+        for start in range(0, len(data), WRITE_CHUNK_SIZE):
+            f.write(data[start : start + WRITE_CHUNK_SIZE])
+
+
+def _read_file(filepath: PathType) -> bytes:
+    with open(filepath, "rb") as f:
+        return f.read()
+
+
+def _remove_file(filepath: PathType) -> None:
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
+
+
+class _TemporaryPath:
+    # the file is deleted once every file object sharing this has been garbage collected, so copies of a file can outlive the original
+    __slots__ = ["path", "__weakref__"]
+
+    def __init__(self, path: PathType):
+        self.path = path
+        weakref.finalize(self, _remove_file, path)
+
+
+async def _write_chunks(
+    chunks: AsyncIterator[bytes], fp: Union[PathType, BinaryIO]
+) -> int:
+    loop = asyncio.get_running_loop()
+    if isinstance(fp, (str, os.PathLike)):
+        file: BinaryIO = await loop.run_in_executor(None, open, fp, "wb")
+        close = True
+    else:
+        file = fp
+        close = False
+
+    written = 0
+    try:
+        async for chunk in chunks:
+            await loop.run_in_executor(None, file.write, chunk)
+            written += len(chunk)
+    finally:
+        if close:
+            await loop.run_in_executor(None, file.close)
+
+    return written
 
 
 class File:
-    def __init__(self, *, raw_bytes: bytes, url: Optional[str] = None):
+    url: Optional[str]
+    _bytes: Optional[bytes]
+    _view: Optional[memoryview]
+    _path: Optional[PathType]
+    _http: Optional[HTTPClient]
+    _owner: Optional[_TemporaryPath]
+    processed: Any
+
+    __slots__ = [
+        "url",
+        "processed",
+        "_bytes",
+        "_view",
+        "_path",
+        "_http",
+        "_owner",
+        "__weakref__",
+    ]
+
+    def __init__(
+        self,
+        *,
+        raw_bytes: Union[bytes, bytearray, memoryview],
+        url: Optional[str] = None,
+    ):
         """Creates a file object
 
         Parameters
         ----------
-        raw_bytes: `bytes`
-            The bytes of the file
+        raw_bytes: Union[`bytes`, `bytearray`, `memoryview`]
+            The bytes of the file. These are not copied
         url: Optional[`url`]
             the files url (if it has one)
 
@@ -25,22 +118,395 @@ class File:
         ----------
         bytes: `bytes`
             The bytes of the file
+        view: `memoryview`
+            A memoryview of the bytes of the file
         url: Optional[`url`]
             the files url (if it has one)
+        processed: `Any`
+            the result of the `process` function the file was requested with, if any. See `ciberedev.processing.ProcessingPool`
         """
 
-        self.bytes = raw_bytes
+        view = memoryview(raw_bytes)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+
+        self._view = view
+        self._bytes = raw_bytes if isinstance(raw_bytes, bytes) else None
+        self._path = None
+        self._http = None
+        self._owner = None
         self.url = url
+        self.processed = None
+
+    @classmethod
+    def from_path(
+        cls, fp: PathType, /, *, url: Optional[str] = None, temporary: bool = False
+    ) -> File:
+        """Creates a file object that is backed by a file on disk
+
+        The file is only read into memory when `ciberedev.file.File.bytes` or `ciberedev.file.File.view` is accessed,
+        and `ciberedev.file.File.save` copies it without reading it into memory.
+
+        Parameters
+        ----------
+        fp: Union[`str`, `os.PathLike`]
+            the path of the file
+        url: Optional[`url`]
+            the files url (if it has one)
+        temporary: `bool`
+            Whether the file on disk should be deleted once the file object is garbage collected. Defaults to `False`
+
+        Returns
+        ----------
+        ciberedev.file.File
+            the file object
+        """
+
+        self = cls.__new__(cls)
+        self._view = None
+        self._bytes = None
+        self._path = fp
+        self._http = None
+        self._owner = _TemporaryPath(fp) if temporary else None
+        self.url = url
+        self.processed = None
+        return self
+
+    @classmethod
+    def _from_url(cls, url: str, http: HTTPClient) -> File:
+        self = cls.__new__(cls)
+        self._view = None
+        self._bytes = None
+        self._path = None
+        self._http = http
+        self._owner = None
+        self.url = url
+        self.processed = None
+        return self
+
+    def __repr__(self) -> str:
+        return f"<File url={self.url}>"
+
+    def _copy(self) -> File:
+        if self._http is not None:
+            return File._from_url(self.url, self._http)  # type: ignore
+        if self._view is None:
+            copy = File.from_path(self._path, url=self.url)  # type: ignore
+            # the copy keeps a temporary file alive, so it isn't deleted while the copy still uses it
+            copy._owner = self._owner
+            return copy
+
+        # shares the underlying buffer, so this does not copy the bytes
+        copy = File(raw_bytes=self._view, url=self.url)
+        copy._bytes = self._bytes
+        return copy
+
+    def is_fetched(self) -> bool:
+        """Returns a bool depending on if the file's bytes are available or not
+
+        Files returned with `fetch=False` are not fetched until `ciberedev.file.File.read` is called
+
+        Returns
+        ----------
+        bool
+            True if the file has been fetched, False if it has not
+        """
+
+        return self._http is None
+
+    async def read(self) -> bytes:
+        """|coro|
+
+        Returns the bytes of the file, downloading them first if the file has not been fetched yet.
+
+        The downloaded bytes are cached, so the file is only downloaded once
+
+        Raises
+        ----------
+        HTTPException
+            The file could not be downloaded
+
+        Returns
+        ----------
+        bytes
+            The bytes of the file
+        """
+
+        if self._http is not None:
+            data = await self._http.get_image_from_url(self.url)  # type: ignore
+            self._bytes = data
+            self._view = memoryview(data)
+            self._http = None
+        elif self._view is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: self.bytes)
+
+        return self.bytes
+
+    @property
+    def bytes(self) -> bytes:
+        """The bytes of the file.
+
+        If the file is backed by a file on disk, this reads it. Setting this replaces the contents of the file
+
+        Raises
+        ----------
+        FileNotFetched
+            The file has not been fetched yet
+        """
+
+        if self._http is not None:
+            raise FileNotFetched(self.url)  # type: ignore
+
+        if self._bytes is None:
+            if self._view is not None:
+                self._bytes = self._view.tobytes()
+            else:
+                self._bytes = _read_file(self._path)  # type: ignore
+            self._view = memoryview(self._bytes)
+
+        return self._bytes
+
+    @bytes.setter
+    def bytes(self, raw_bytes: Union[bytes, bytearray, memoryview]) -> None:
+        view = memoryview(raw_bytes)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+
+        # replaces the file's contents, so it is no longer backed by a file on disk or waiting to be fetched
+        self._view = view
+        self._bytes = raw_bytes if isinstance(raw_bytes, bytes) else None
+        self._path = None
+        self._http = None
+        self._owner = None
+
+    @property
+    def view(self) -> memoryview:
+        """A memoryview of the bytes of the file, which can be sliced without copying them.
+
+        If the file is backed by a file on disk, this reads it
+
+        Raises
+        ----------
+        FileNotFetched
+            The file has not been fetched yet
+        """
+
+        if self._view is None:
+            self.bytes
+
+        return self._view  # type: ignore
 
-    async def save(self, fp: str, /) -> None:
+    def _save(self, fp: PathType) -> None:
+        if self._http is not None:
+            raise FileNotFetched(self.url)  # type: ignore
+
+        if self._view is None:
+            # copyfile uses os.sendfile where it is available, so the data never enters userspace
+            shutil.copyfile(self._path, fp)  # type: ignore
+        else:
+            _write_to_file(fp, self._view)
+
+    async def save(
+        self, fp: PathType, /, *, executor: Optional[Executor] = None
+    ) -> None:
         """Saves the file
 
+        If the file has not been fetched yet, it is downloaded straight to disk without being cached
+
         Paramters
         ----------
-        fp: `str`
+        fp: Union[`str`, `os.PathLike`]
             The filepath/filename the file should be saved to
+        executor: Optional[`concurrent.futures.Executor`]
+            The executor the file should be written in. Defaults to the event loop's default executor
         """
 
-        func = partial_func(_write_to_file, fp, self.bytes)
+        if self._http is not None:
+            await _write_chunks(self._http.stream_image_from_url(self.url), fp)  # type: ignore
+            return
+
+        func = partial_func(self._save, fp)
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, func)
+        await loop.run_in_executor(executor, func)
+
+
+async def save_many(
+    files: Iterable[Tuple[File, PathType]],
+    /,
+    *,
+    executor: Optional[Executor] = None,
+    max_workers: int = 4,
+) -> None:
+    """|coro|
+
+    Saves a batch of files
+
+    Unless an executor is given, the files are written in a dedicated thread pool,
+    so saving a large batch does not starve the event loop's default executor.
+    Files that have not been fetched yet are downloaded straight to disk, like `ciberedev.file.File.save`
+
+    Parameters
+    ----------
+    files: Iterable[tuple[`ciberedev.file.File`, Union[`str`, `os.PathLike`]]]
+        the files to be saved, and the filepath/filename each one should be saved to
+    executor: Optional[`concurrent.futures.Executor`]
+        The executor the files should be written in
+    max_workers: `int`
+        The amount of threads the dedicated thread pool has, when no executor is given. Defaults to `4`
+    """
+
+    pool = executor or ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="ciberedev-io"
+    )
+
+    try:
+        # files that have not been fetched yet are downloaded straight to disk
+        await asyncio.gather(*[file.save(fp, executor=pool) for file, fp in files])
+    finally:
+        if executor is None:
+            pool.shutdown(wait=False)
+
+
+class StreamedFile:
+    url: str
+    chunk_size: int
+    _http: HTTPClient
+
+    __slots__ = ["url", "chunk_size", "_http"]
+
+    def __init__(self, *, url: str, http: HTTPClient, chunk_size: int):
+        """Creates a streamed file object
+
+        THIS SHOULD NOT BE CREATED MANUALLY, LET THE INTERNALS CREATE THEM
+
+        Unlike `ciberedev.file.File`, a streamed file never holds the whole file in memory.
+        Its contents are downloaded chunk by chunk every time it is iterated over or saved.
+
+        Parameters
+        ----------
+        url: `str`
+            the files url
+        http: `HTTPClient`
+            the http client used to download the file
+        chunk_size: `int`
+            the size of the chunks the file is downloaded in
+
+        Attributes
+        ----------
+        url: `str`
+            the files url
+        chunk_size: `int`
+            the size of the chunks the file is downloaded in
+        """
+
+        self.url = url
+        self.chunk_size = chunk_size
+        self._http = http
+
+    def __repr__(self) -> str:
+        return f"<StreamedFile url={self.url}>"
+
+    def _copy(self) -> StreamedFile:
+        return StreamedFile(url=self.url, http=self._http, chunk_size=self.chunk_size)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.iter_chunks()
+
+    async def iter_chunks(
+        self, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Downloads the file, yielding it chunk by chunk
+
+        Parameters
+        ----------
+        chunk_size: Optional[`int`]
+            the size of the chunks. Defaults to `ciberedev.file.StreamedFile.chunk_size`
+
+        Raises
+        ----------
+        HTTPException
+            The file could not be downloaded
+
+        Yields
+        ----------
+        bytes
+            the next chunk of the file
+        """
+
+        async for chunk in self._http.stream_image_from_url(
+            self.url, chunk_size or self.chunk_size
+        ):
+            yield chunk
+
+    async def read(self) -> File:
+        """|coro|
+
+        Downloads the whole file into memory
+
+        Raises
+        ----------
+        HTTPException
+            The file could not be downloaded
+
+        Returns
+        ----------
+        ciberedev.file.File
+            the downloaded file
+        """
+
+        chunks = [chunk async for chunk in self.iter_chunks()]
+        return File(raw_bytes=b"".join(chunks), url=self.url)
+
+    async def spool(self) -> File:
+        """|coro|
+
+        Downloads the file into a temporary file on disk, one chunk at a time
+
+        Raises
+        ----------
+        HTTPException
+            The file could not be downloaded
+
+        Returns
+        ----------
+        ciberedev.file.File
+            a file object backed by the temporary file, which is deleted once the file object is garbage collected
+        """
+
+        loop = asyncio.get_running_loop()
+        fd, path = await loop.run_in_executor(
+            None, partial_func(tempfile.mkstemp, prefix="ciberedev-")
+        )
+        os.close(fd)
+
+        try:
+            await self.save(path)
+        except BaseException:
+            _remove_file(path)
+            raise
+
+        return File.from_path(path, url=self.url, temporary=True)
+
+    async def save(self, fp: Union[PathType, BinaryIO], /) -> int:
+        """|coro|
+
+        Downloads the file straight into the given path or file-like object, one chunk at a time
+
+        Parameters
+        ----------
+        fp: Union[`str`, `os.PathLike`, `BinaryIO`]
+            The filepath/filename the file should be saved to, or a binary file-like object to write to
+
+        Raises
+        ----------
+        HTTPException
+            The file could not be downloaded
+
+        Returns
+        ----------
+        int
+            the amount of bytes written
+        """
+
+        return await _write_chunks(self.iter_chunks(), fp)
@@ -1,51 +1,103 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import sys
 import time
 from asyncio import AbstractEventLoop
-from typing import TYPE_CHECKING, Any, Coroutine, Literal, Optional, TypeVar, Union
+from functools import partial
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Literal,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
 
 import aiohttp
 from aiohttp import ClientSession
-from aiohttp.client_exceptions import ClientConnectionError
+from aiohttp.client_exceptions import ClientConnectionError, ClientError
 
 from . import __version__
-from .errors import APIOffline, HTTPException, InternalServerError, UnknownStatusCode
+from .cache import ResponseCache
+from .circuitbreaker import CircuitBreaker
+from .endpoints import Endpoint, LoadBalancer
+from .errors import (
+    APIOffline,
+    CircuitOpen,
+    HTTPException,
+    InternalServerError,
+    RequestTimedOut,
+    UnknownStatusCode,
+)
+from .metrics import Metrics
+from .pool import PoolConfig
+from .ratelimits import Bucket, parse_retry_after
+from .retries import RetryPolicy
+from .timeouts import Timeout, current_deadline, get_client_timeout, timeout_scope
+from .tracing import (
+    CacheHitEvent,
+    ImageDownloadedEvent,
+    OpenTelemetryTracer,
+    RequestEndEvent,
+    RequestTrace,
+    RetryEvent,
+    attach_trace_config,
+    create_trace_config,
+)
 from .types.image import AddImageText as AddImageTextPayload
 from .types.image import ImageToAscii as ImageToAsciiPayload
 from .types.image import Laugh as LaughPayload
 from .types.random import RandomWordData
 from .types.screenshot import ScreenshotData
 from .types.searching import GetSearchResultData
+from .uploads import Upload, UploadSource
+from .utils import SingleFlight, from_json
+
+T = TypeVar("T")
 
 if TYPE_CHECKING:
     from .client import Client
 
-    T = TypeVar("T")
     Response = Coroutine[Any, Any, T]
 
 LOGGER = logging.getLogger("ciberedev.http")
+BASE_URL = "https://api.cibere.dev"
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
 __all__ = []
 
 
+JSONLoads = Callable[[bytes], Any]
+
+
+def is_json(response: aiohttp.ClientResponse, /) -> bool:
+    # content_type has parameters such as '; charset=utf-8' stripped
+    content_type = response.content_type
+    return content_type == "application/json" or content_type.endswith("+json")
+
+
 async def json_or_text(
-    response: aiohttp.ClientResponse, /
+    response: aiohttp.ClientResponse, /, loads: JSONLoads = from_json
 ) -> Union[dict[str, Any], str]:
-    text = await response.text(encoding="utf-8")
-    try:
-        if response.headers["content-type"] == "application/json":
-            try:
-                return json.loads(text)
-            except json.JSONDecodeError:
-                pass
-    except KeyError:
-        pass
+    body = await response.read()
+    if is_json(response):
+        try:
+            return loads(body)
+        except ValueError:
+            pass
 
-    return text
+    return body.decode("utf-8")
 
 
 async def error_or_text(data: Union[dict, str]) -> str:
@@ -56,7 +108,7 @@ async def error_or_text(data: Union[dict, str]) -> str:
 
 
 class Route:
-    __slots__ = ["method", "endpoint"]
+    __slots__ = ["method", "endpoint", "path", "bucket"]
 
     def __init__(
         self,
@@ -66,108 +118,651 @@ class Route:
     ):
         self.method = method
         self.endpoint = endpoint
+        self.path = sys.intern(urlsplit(endpoint).path)
+        self.bucket = f"{method} {endpoint}"
+
+    def __repr__(self) -> str:
+        return f"<Route method={self.method} endpoint={self.endpoint}>"
+
+
+# every route of the api. These are built into `Route` objects once per client, since the base url can differ between clients
+ROUTES: dict[str, tuple[Literal["POST", "GET"], str]] = {
+    "ping": ("GET", "/ping"),
+    "take_screenshot": ("POST", "/screenshot"),
+    "get_search_results": ("GET", "/search"),
+    "get_random_words": ("GET", "/random/word"),
+    "convert_image_to_ascii": ("GET", "/image/ascii"),
+    "add_text_to_image": ("GET", "/image/add-text"),
+    "image_laugh": ("GET", "/image/laugh"),
+    "invert_image": ("GET", "/image/invert"),
+}
 
 
 class HTTPClient:
     _session: Optional[ClientSession]
     _client: Client
     _loop: Optional[AbstractEventLoop]
+    _pool: PoolConfig
+    _buckets: dict[str, Bucket]
+    _cache: Optional[ResponseCache]
+    _inflight: SingleFlight[Any]
+    _last_ping: float
+    _retry_policy: RetryPolicy
+    _circuit_breaker: Optional[CircuitBreaker]
+    _recovery_task: Optional[asyncio.Task[None]]
+    _timeout: Timeout
+    _hooks: frozenset[str]
+    _tasks: set[asyncio.Task[Any]]
+    _tracer: Optional[OpenTelemetryTracer]
+    _json_loads: JSONLoads
+    _base_url: str
+    _balancer: Optional[LoadBalancer]
+    _routes: dict[str, Route]
+    _headers: Mapping[str, str]
     latency: Optional[float]
     requests: int
+    metrics: Metrics
+
+    __slots__ = [
+        "_session",
+        "_client",
+        "_loop",
+        "_pool",
+        "_buckets",
+        "_cache",
+        "_inflight",
+        "_last_ping",
+        "_retry_policy",
+        "_circuit_breaker",
+        "_recovery_task",
+        "_timeout",
+        "_hooks",
+        "_tasks",
+        "_tracer",
+        "_json_loads",
+        "_base_url",
+        "_balancer",
+        "_routes",
+        "_headers",
+        "user_agent",
+        "latency",
+        "requests",
+        "metrics",
+    ]
 
-    __slots__ = ["_session", "_client", "_loop", "user_agent", "latency", "requests"]
+    def __init__(
+        self,
+        *,
+        session: Optional[ClientSession],
+        client: Client,
+        pool: Optional[PoolConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        timeout: Optional[Timeout] = None,
+        metrics: Optional[Metrics] = None,
+        hooks: Iterable[str] = (),
+        tracer: Optional[OpenTelemetryTracer] = None,
+        json_loads: Optional[JSONLoads] = None,
+        base_url: Optional[Union[str, LoadBalancer]] = None,
+    ):
+        if session is not None:
+            attach_trace_config(session)
 
-    def __init__(self, *, session: Optional[ClientSession], client: Client):
         self._session = session
         self._client = client
         self._loop: Optional[AbstractEventLoop] = None
+        self._pool = pool or PoolConfig()
+        self._buckets = {}
+        self._cache = cache
+        self._inflight = SingleFlight()
+        self._last_ping = 0.0
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._circuit_breaker = circuit_breaker
+        self._recovery_task = None
+        self._timeout = timeout or Timeout()
+        self._hooks = frozenset(hooks)
+        self._tasks = set()
+        self._tracer = tracer
+        self._json_loads = json_loads or from_json
+        if isinstance(base_url, LoadBalancer):
+            self._balancer = base_url
+            self._base_url = base_url.endpoints[0].url
+        else:
+            self._balancer = None
+            self._base_url = (base_url or BASE_URL).rstrip("/")
+        self._routes = {
+            name: Route(method=method, endpoint=f"{self._base_url}{path}")
+            for name, (method, path) in ROUTES.items()
+        }
         user_agent = "ciberedev.py (https://github.com/cibere/ciberedev.py {0}) Python/{1[0]}.{1[1]} aiohttp/{2}"
         self.user_agent = user_agent.format(
             __version__, sys.version_info, aiohttp.__version__
         )
+        self._headers = MappingProxyType({"User-Agent": self.user_agent})
         self.requests = 0
         self.latency = None
+        self.metrics = metrics or Metrics()
+
+    def _get_session(self) -> ClientSession:
+        if self._session is None:
+            self._session = ClientSession(
+                connector=self._pool.create_connector(),
+                trace_configs=[create_trace_config()],
+            )
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+
+        return self._session
+
+    async def close(self) -> None:
+        if self._recovery_task is not None:
+            self._recovery_task.cancel()
+            self._recovery_task = None
+        if self._session:
+            await self._session.close()
+
+    def _get_listener(self, name: str) -> Optional[Callable[[Any], None]]:
+        # events are only created when something listens to them, so unused hooks cost nothing
+        if name not in self._hooks and self._tracer is None:
+            return None
+        return partial(self.dispatch, name)
+
+    def dispatch(self, name: str, event: Any) -> None:
+        if self._tracer is not None:
+            self._tracer.dispatch(name, event)
+        if name in self._hooks:
+            self._create_task(getattr(self._client, f"on_{name}")(event))
+
+    def _create_task(self, coro: Coroutine[Any, Any, Any]) -> None:
+        # the event loop only keeps weak references to tasks, so they are kept here until they finish
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def prewarm(self, connections: Optional[int] = None) -> None:
+        amount = self._pool.prewarm if connections is None else connections
+        if amount <= 0:
+            return
+
+        session = self._get_session()
+        if self._balancer is None:
+            urls = [self._base_url]
+        else:
+            urls = [endpoint.url for endpoint in self._balancer.endpoints]
+
+        async def open_connection(url: str) -> None:
+            try:
+                async with session.head(f"{url}/ping", ssl=False):
+                    pass
+            except ClientError as e:
+                LOGGER.debug("Failed to prewarm a connection: %r", e)
+
+        # the connections are spread over every mirror
+        await asyncio.gather(
+            *[open_connection(urls[i % len(urls)]) for i in range(amount)]
+        )
+        LOGGER.debug("Prewarmed %s connections", amount)
 
     async def ping(self) -> float:
-        route = Route(method="GET", endpoint="https://api.cibere.dev/ping")
+        cache = self._cache
+        ttl = cache.ttl_for("/ping") if cache else 0.0
+        if cache is None or ttl <= 0:
+            return await self._ping()
+
+        if self.latency is not None and time.monotonic() - self._last_ping < ttl:
+            self._cache_hit(cache, "/ping", "ping")
+            return self.latency
+
+        if "ping" in self._inflight:
+            self._cache_hit(cache, "/ping", "ping")
+        else:
+            cache.misses += 1
+
+        return await self._inflight.do("ping", self._ping)
+
+    async def _ping(self) -> float:
+        balancer = self._balancer
+        if balancer is None:
+            latency = await self._ping_endpoint(None)
+        else:
+            # every mirror is pinged, so the latency strategy has something to go off of
+            results = await asyncio.gather(
+                *[self._ping_endpoint(mirror) for mirror in balancer.endpoints],
+                return_exceptions=True,
+            )
+            latencies = [r for r in results if isinstance(r, float)]
+            if not latencies:
+                raise results[0]  # type: ignore
+            latency = min(latencies)
+
+        self.latency = latency
+        self._last_ping = time.monotonic()
+        return latency
+
+    async def _ping_endpoint(self, mirror: Optional[Endpoint]) -> float:
+        route = self._routes["ping"]
 
         before = time.perf_counter()
-        await self.request(route)
+        await self._send(route, mirror=mirror)
         after = time.perf_counter()
 
         latency = after - before
-        self.latency = latency
+        if mirror is not None:
+            self._balancer.record_latency(mirror, latency)  # type: ignore
         return latency
 
+    async def with_timeout(
+        self,
+        coro: Awaitable[T],
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> T:
+        resolved = Timeout.resolve(timeout, self._timeout)
+        with timeout_scope(resolved, deadline) as resolved_deadline:
+            if resolved_deadline is None:
+                return await coro
+
+            try:
+                return await asyncio.wait_for(
+                    coro, resolved_deadline - time.monotonic()
+                )
+            except RequestTimedOut:
+                raise
+            except asyncio.TimeoutError as e:
+                raise RequestTimedOut() from e
+
+    def _get_client_timeout(self, endpoint: str) -> aiohttp.ClientTimeout:
+        timeout = get_client_timeout(self._timeout)
+        if timeout is None:
+            raise RequestTimedOut(endpoint)
+        return timeout
+
+    def _check_circuit(self, endpoint: str) -> bool:
+        # returns True if this request is the trial of a half open circuit
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return False
+        if not breaker.allow_request():
+            raise CircuitOpen(endpoint)
+        return breaker.state == "half_open"
+
+    def _release_trial(self) -> None:
+        # the trial is released if it ended without recording a success or failure, so the circuit can not get stuck half open
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.release_trial()
+
+    def _record_success(self) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success()
+
+    def _record_failure(self) -> None:
+        breaker = self._circuit_breaker
+        if breaker is None or not breaker.record_failure():
+            return
+
+        LOGGER.warning(
+            "The circuit breaker has opened after %s failures. Requests will fail until the api is reachable again",
+            breaker.failures,
+        )
+        if self._recovery_task is None or self._recovery_task.done():
+            loop = asyncio.get_running_loop()
+            self._recovery_task = loop.create_task(self._recover(breaker))
+
+    async def _recover(self, breaker: CircuitBreaker) -> None:
+        while breaker.state != "closed":
+            await asyncio.sleep(breaker.recovery_timeout)
+            breaker.half_open()
+
+            try:
+                await self._probe()
+            except Exception as e:
+                # the task has to keep going no matter what, or the circuit would stay open forever
+                LOGGER.debug("Circuit breaker probe failed: %r", e)
+
+        LOGGER.info("The circuit breaker has closed. Requests are being sent again")
+
+    async def _probe(self) -> None:
+        # only a single trial request is let through, so only one mirror is pinged.
+        # The balancer skips ejected mirrors, so a dead mirror can not keep the circuit open while the others are healthy
+        latency = await self._ping_endpoint(self._pick_mirror())
+        self.latency = latency
+        self._last_ping = time.monotonic()
+
+    def _get_bucket(self, route: Route) -> Bucket:
+        try:
+            return self._buckets[route.bucket]
+        except KeyError:
+            bucket = self._buckets[route.bucket] = Bucket(route.bucket)
+            return bucket
+
+    def _cache_hit(self, cache: ResponseCache, route: str, key: Hashable) -> None:
+        cache.hits += 1
+        on_cache_hit = self._get_listener("cache_hit")
+        if on_cache_hit is not None:
+            on_cache_hit(CacheHitEvent(cache="memory", name=route, key=key))
+
+    def _get_cache_key(
+        self, route: Route, kwargs: dict[str, Any]
+    ) -> Optional[Hashable]:
+        if self._cache is None or route.method != "GET":
+            return None
+        if "json" in kwargs or "data" in kwargs or "upload" in kwargs:
+            return None
+        if self._cache.ttl_for(route.path) <= 0:
+            return None
+
+        params = kwargs.get("params") or {}
+        normalized = tuple(sorted((str(k), str(v)) for k, v in params.items()))
+        return (route.method, route.endpoint, normalized)
+
     async def request(self, route: Route, **kwargs) -> Any:
-        if self._session is None:
-            self._session = ClientSession()
-        if self._loop is None:
-            self._loop = asyncio.get_running_loop()
+        key = self._get_cache_key(route, kwargs)
+        if key is None:
+            data, _ = await self._send(route, **kwargs)
+            return data
+
+        cache = self._cache
+        assert cache is not None
+
+        try:
+            data = cache.get(key)
+        except KeyError:
+            pass
+        else:
+            self._cache_hit(cache, route.path, key)
+            return data
 
-        self.requests += 1
+        if key in self._inflight:
+            self._cache_hit(cache, route.path, key)
+        else:
+            cache.misses += 1
 
-        headers = kwargs.pop("headers", {})
-        headers["User-Agent"] = self.user_agent
-        url = route.endpoint
-        endpoint = f"/{route.method.split('/')[-1]}"
+        async def send_and_cache() -> Any:
+            data, size = await self._send(route, **kwargs)
+            cache.set(key, data, ttl=cache.ttl_for(route.path), size=size)
+            return data
 
-        if "json" in kwargs:
-            headers["Content-Type"] = "application/json"
+        return await self._inflight.do(key, send_and_cache)
 
-        for current_try in range(3):
-            try:
-                res = await self._session.request(
-                    route.method, url, ssl=False, **kwargs
-                )
-                data = await json_or_text(res)
-            except ClientConnectionError:
-                raise APIOffline(endpoint)
+    def _pick_mirror(self) -> Optional[Endpoint]:
+        if self._balancer is None:
+            return None
+        return self._balancer.pick()
 
-            if 300 > res.status >= 200:
-                return data
-            elif res.status == 500:
-                time = 2 * current_try
+    def _record_mirror_failure(self, mirror: Optional[Endpoint]) -> None:
+        if mirror is None or not self._balancer.record_failure(mirror):  # type: ignore
+            return
 
-                LOGGER.warning(
-                    "API returned a 500 status code at '%s'. Retrying in %s seconds",
-                    endpoint,
-                )
-                await asyncio.sleep(time)
-                continue
-            elif res.status == 429:
-                self._loop.create_task(self._client.on_ratelimit(endpoint))
-                await asyncio.sleep(5)
-                return await self.request(route)
-            elif res.status == 502:
-                raise APIOffline(endpoint)
-            elif res.status == 400:
-                error = await error_or_text(data)
-                raise HTTPException(error)
-            else:
-                raise UnknownStatusCode(res.status)
+        LOGGER.warning(
+            "The mirror '%s' has been ejected for %s seconds after %s failures",
+            mirror.url,
+            self._balancer.ejection_time,  # type: ignore
+            self._balancer.failure_threshold,  # type: ignore
+        )
 
-        raise InternalServerError()
+    async def _send(
+        self, route: Route, *, mirror: Optional[Endpoint] = None, **kwargs
+    ) -> tuple[Any, int]:
+        session = self._get_session()
 
-    async def get_image_from_url(self, url: str) -> bytes:
-        if self._session is None:
-            self._session = ClientSession()
-        if self._loop is None:
-            self._loop = asyncio.get_running_loop()
+        self.requests += 1
 
-        res = await self._session.get(url, ssl=False)
-        if res.status == 200:
-            return await res.read()
+        # aiohttp sets the Content-Type of json and multipart bodies itself, so the default headers can be shared
+        extra_headers = kwargs.pop("headers", None)
+        if extra_headers is None:
+            headers = self._headers
         else:
-            txt: str = await json_or_text(res)  # type: ignore[PylancereportGeneralTypeIssues] # very wierd error that is false
-            raise HTTPException(txt)
+            headers = {**self._headers, **extra_headers}
+
+        url = route.endpoint
+        pinned = mirror
+        endpoint = route.path
+
+        upload: Optional[Upload] = kwargs.pop("upload", None)
+        replayable = upload is None or upload.replayable
+
+        bucket = self._get_bucket(route)
+        policy = self._retry_policy
+        metrics = self.metrics.route(route.path)
+        on_start = self._get_listener("request_start")
+        on_end = self._get_listener("request_end")
+        started_at = time.monotonic()
+        retry = 0
+        attempt = 0
+
+        while True:
+            await bucket.acquire()
+            timeout = self._get_client_timeout(endpoint)
+            attempt += 1
+            if upload is not None:
+                # a multipart body can only be sent once, so every attempt gets a new one
+                kwargs["data"] = upload.build()
+
+            # retries pick a mirror again, so they can go to a different one
+            mirror = pinned or self._pick_mirror()
+
+            error: Exception
+            trace = RequestTrace(route.path, attempt, on_start)
+            trial = self._check_circuit(endpoint)
+            if mirror is not None:
+                url = f"{mirror.url}{route.path}"
+                mirror.outstanding += 1
+
+            sent_at = time.perf_counter()
+            sent_at_wall = time.time()
+            try:
+                res = await session.request(
+                    route.method,
+                    url,
+                    headers=headers,
+                    ssl=False,
+                    timeout=timeout,
+                    trace_request_ctx=trace,
+                    **kwargs,
+                )
+                headers_at = time.perf_counter()
+                data = await json_or_text(res, self._json_loads)
+                size = len(await res.read())
+            except (*policy.exceptions, ClientConnectionError) as e:
+                metrics.observe_error()
+                self._record_failure()
+                self._record_mirror_failure(mirror)
+                if on_end is not None:
+                    on_end(
+                        RequestEndEvent(
+                            method=route.method,
+                            url=url,
+                            route=route.path,
+                            attempt=attempt,
+                            started_at=sent_at_wall,
+                            status=None,
+                            error=e,
+                            connect=trace.connect,
+                            ttfb=0.0,
+                            read=0.0,
+                            duration=time.perf_counter() - sent_at,
+                            bytes_in=0,
+                            bytes_out=trace.bytes_out,
+                        )
+                    )
+                # aiohttp's per-attempt timeouts are timeouts, not the api being offline
+                if isinstance(e, asyncio.TimeoutError):
+                    error = RequestTimedOut(endpoint)
+                else:
+                    error = APIOffline(endpoint)
+                error.__cause__ = e
+                if not isinstance(e, policy.exceptions):
+                    raise error
+
+                reason = type(e).__name__
+            else:
+                finished_at = time.perf_counter()
+                ttfb = headers_at - sent_at - trace.connect
+                metrics.observe(
+                    status=res.status,
+                    connect=trace.connect,
+                    ttfb=ttfb,
+                    read=finished_at - headers_at,
+                    bytes_in=size,
+                    bytes_out=trace.bytes_out,
+                )
+                if on_end is not None:
+                    on_end(
+                        RequestEndEvent(
+                            method=route.method,
+                            url=str(res.url),
+                            route=route.path,
+                            attempt=attempt,
+                            started_at=sent_at_wall,
+                            status=res.status,
+                            error=None,
+                            connect=trace.connect,
+                            ttfb=ttfb,
+                            read=finished_at - headers_at,
+                            duration=finished_at - sent_at,
+                            bytes_in=size,
+                            bytes_out=trace.bytes_out,
+                        )
+                    )
+
+                bucket.update(res.headers)
+                if res.status >= 500:
+                    self._record_failure()
+                    self._record_mirror_failure(mirror)
+                else:
+                    self._record_success()
+                    if mirror is not None:
+                        self._balancer.record_success(mirror)  # type: ignore
+
+                if 300 > res.status >= 200:
+                    return data, size
+                elif res.status == 429:
+                    metrics.ratelimits += 1
+                    retry_after = parse_retry_after(res.headers)
+                    if not replayable:
+                        bucket.ratelimited(retry_after)
+                        raise HTTPException(
+                            f"Ratelimited at '{endpoint}', and the upload can not be sent again"
+                        )
+                    if bucket.ratelimited(retry_after):
+                        LOGGER.debug(
+                            "Bucket %r has been locked for %s seconds",
+                            bucket.key,
+                            retry_after,
+                        )
+                        self._create_task(self._client.on_ratelimit(endpoint))
+                    continue
+                elif res.status == 400:
+                    message = await error_or_text(data)
+                    raise HTTPException(message)
+                elif res.status == 500:
+                    error = InternalServerError()
+                elif res.status in (502, 503, 504):
+                    error = APIOffline(endpoint)
+                else:
+                    error = UnknownStatusCode(res.status)
+
+                if res.status not in policy.statuses:
+                    raise error
+                reason = f"a {res.status} status code"
+            finally:
+                if mirror is not None:
+                    mirror.outstanding -= 1
+                if trial:
+                    self._release_trial()
+
+            if not replayable:
+                raise error
+
+            delay = policy.get_delay(retry, time.monotonic() - started_at)
+            if delay is None:
+                raise error
+
+            deadline = current_deadline()
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise RequestTimedOut(endpoint) from error
+
+            LOGGER.warning(
+                "Request to '%s' failed with %s. Retrying in %.2f seconds",
+                endpoint,
+                reason,
+                delay,
+            )
+            on_retry = self._get_listener("retry")
+            if on_retry is not None:
+                on_retry(
+                    RetryEvent(
+                        method=route.method,
+                        url=url,
+                        route=route.path,
+                        attempt=attempt,
+                        delay=delay,
+                        reason=reason,
+                        error=error,
+                    )
+                )
+            retry += 1
+            metrics.retries += 1
+            await asyncio.sleep(delay)
+
+    def _image_downloaded(
+        self, url: str, size: int, started_at: float, started: float, streamed: bool
+    ) -> None:
+        on_downloaded = self._get_listener("image_downloaded")
+        if on_downloaded is not None:
+            on_downloaded(
+                ImageDownloadedEvent(
+                    url=url,
+                    size=size,
+                    started_at=started_at,
+                    duration=time.perf_counter() - started,
+                    streamed=streamed,
+                )
+            )
+
+    async def get_image_from_url(self, url: str) -> bytes:
+        session = self._get_session()
+        timeout = self._get_client_timeout(url)
+        started_at, started = time.time(), time.perf_counter()
+
+        try:
+            res = await session.get(url, ssl=False, timeout=timeout)
+            if res.status == 200:
+                data = await res.read()
+                self._image_downloaded(url, len(data), started_at, started, False)
+                return data
+            else:
+                txt: str = await json_or_text(res)  # type: ignore[PylancereportGeneralTypeIssues] # very wierd error that is false
+                raise HTTPException(txt)
+        except asyncio.TimeoutError as e:
+            raise RequestTimedOut(url) from e
+
+    async def stream_image_from_url(
+        self, url: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        session = self._get_session()
+        timeout = self._get_client_timeout(url)
+        started_at, started = time.time(), time.perf_counter()
+        size = 0
+
+        try:
+            async with session.get(url, ssl=False, timeout=timeout) as res:
+                if res.status != 200:
+                    txt: str = await json_or_text(res)  # type: ignore
+                    raise HTTPException(txt)
+
+                async for chunk in res.content.iter_chunked(chunk_size):
+                    size += len(chunk)
+                    yield chunk
+        except asyncio.TimeoutError as e:
+            raise RequestTimedOut(url) from e
+
+        self._image_downloaded(url, size, started_at, started, True)
 
     def take_screenshot(self, url: str, delay: int) -> Response[ScreenshotData]:
         args = {"url": url, "delay": delay}
-        route = Route(
-            method="POST",
-            endpoint="https://api.cibere.dev/screenshot",
-        )
+        route = self._routes["take_screenshot"]
 
         return self.request(route, params=args)
 
@@ -175,19 +770,13 @@ class HTTPClient:
         self, query: str, amount: int
     ) -> Response[GetSearchResultData]:
         args = {"query": query, "amount": amount}
-        route = Route(
-            method="GET",
-            endpoint="https://api.cibere.dev/search",
-        )
+        route = self._routes["get_search_results"]
 
         return self.request(route, params=args)
 
     def get_random_words(self, amount: int) -> Response[RandomWordData]:
         args = {"amount": str(amount)}
-        route = Route(
-            method="GET",
-            endpoint="https://api.cibere.dev/random/word",
-        )
+        route = self._routes["get_random_words"]
         return self.request(route, params=args)
 
     def convert_image_to_ascii(
@@ -197,10 +786,7 @@ class HTTPClient:
         if width:
             args["width"] = str(width)
 
-        route = Route(
-            method="GET",
-            endpoint="https://api.cibere.dev/image/ascii",
-        )
+        route = self._routes["convert_image_to_ascii"]
         return self.request(route, params=args)
 
     def add_text_to_image(
@@ -208,38 +794,27 @@ class HTTPClient:
     ) -> Response[AddImageTextPayload]:
         data = {"url": url, "text": text, "color": list(color)}
 
-        route = Route(
-            method="GET",
-            endpoint="https://api.cibere.dev/image/add-text",
-        )
+        route = self._routes["add_text_to_image"]
 
-        return self.request(route)
+        return self.request(route, json=data)
 
     def image_laugh(
         self,
         url: Optional[str] = None,
-        bytes_: Optional[bytes] = None,
+        image: Optional[UploadSource] = None,
         style: Literal[1, 2] = 2,
     ) -> Response[LaughPayload]:
-        data: dict[str, Any] = {"style": style}
-
-        if url:
-            data["url"] = url
-        if bytes_:
-            data["bytes"] = bytes_
+        route = self._routes["image_laugh"]
 
-        route = Route(method="GET", endpoint="https://api.cibere.dev/image/laugh")
-        return self.request(route, json=data)
+        if image is not None:
+            return self.request(route, upload=Upload(image, fields={"style": style}))
+        return self.request(route, json={"style": style, "url": url})
 
     def invert_image(
-        self, url: Optional[str] = None, bytes_: Optional[bytes] = None
+        self, url: Optional[str] = None, image: Optional[UploadSource] = None
     ) -> Response[LaughPayload]:
-        data: dict[str, Any] = {}
+        route = self._routes["invert_image"]
 
-        if url:
-            data["url"] = url
-        if bytes_:
-            data["bytes"] = bytes_
-
-        route = Route(method="GET", endpoint="https://api.cibere.dev/image/invert")
-        return self.request(route, json=data)
+        if image is not None:
+            return self.request(route, upload=Upload(image))
+        return self.request(route, json={"url": url})
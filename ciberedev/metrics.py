@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Iterable, Optional
+
+__all__ = ["Histogram", "RouteMetrics", "Metrics"]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+PHASES = ("connect", "ttfb", "read", "total")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_le(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int]
+    count: int
+    sum: float
+    max: float
+
+    __slots__ = ["buckets", "counts", "count", "sum", "max"]
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """Creates a fixed bucket histogram, which records durations in constant memory
+
+        Parameters
+        ----------
+        buckets: Iterable[`float`]
+            The upper bounds of the buckets, in seconds. Defaults to 13 buckets between 5ms and 60s
+
+        Attributes
+        ----------
+        buckets: tuple[`float`]
+            The upper bounds of the buckets, in seconds
+        counts: list[`int`]
+            The amount of values in each bucket. The last item is for values above the last bucket
+        count: `int`
+            The amount of recorded values
+        sum: `float`
+            The sum of the recorded values
+        max: `float`
+            The largest recorded value
+        """
+
+        self.buckets = tuple(sorted(buckets))
+        if not self.buckets:
+            raise TypeError("buckets can not be empty")
+
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def __repr__(self) -> str:
+        return f"<Histogram count={self.count} p50={self.percentile(0.5)} p99={self.percentile(0.99)}>"
+
+    def observe(self, value: float) -> None:
+        """Records a value
+
+        Parameters
+        ----------
+        value: `float`
+            the value, in seconds
+        """
+
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimates a percentile of the recorded values
+
+        The value is interpolated within the bucket it falls in, the same way Prometheus' `histogram_quantile` does,
+        and is never above the largest recorded value.
+
+        Parameters
+        ----------
+        q: `float`
+            the percentile, between `0` and `1`. Ex: `0.95`
+
+        Returns
+        ----------
+        Optional[float]
+            the estimated value, or `None` if nothing has been recorded
+        """
+
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets, self.counts):
+            if count and cumulative + count >= rank:
+                estimate = lower + (upper - lower) * (rank - cumulative) / count
+                return min(estimate, self.max)
+            cumulative += count
+            lower = upper
+
+        # the value is above the last bucket, so the largest value is the best estimate
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        """Gives you a summary of the histogram
+
+        Returns
+        ----------
+        dict[str, Any]
+            the `count`, `sum`, `max`, `p50`, `p95` and `p99` of the recorded values
+        """
+
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+    def reset(self) -> None:
+        """Removes every recorded value"""
+
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class RouteMetrics:
+    route: str
+    requests: int
+    statuses: dict[int, int]
+    errors: int
+    retries: int
+    ratelimits: int
+    bytes_in: int
+    bytes_out: int
+    connect: Histogram
+    ttfb: Histogram
+    read: Histogram
+    total: Histogram
+
+    __slots__ = [
+        "route",
+        "requests",
+        "statuses",
+        "errors",
+        "retries",
+        "ratelimits",
+        "bytes_in",
+        "bytes_out",
+        "connect",
+        "ttfb",
+        "read",
+        "total",
+    ]
+
+    def __init__(self, route: str, *, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """The metrics of a single api route. You should not be creating these yourself
+
+        Every attempt is counted separately, so a request that was retried twice counts as 3 requests.
+
+        Attributes
+        ----------
+        route: `str`
+            the route. Ex: '/screenshot'
+        requests: `int`
+            The amount of requests sent to the route
+        statuses: dict[`int`, `int`]
+            The amount of responses per status code
+        errors: `int`
+            The amount of requests that failed without a response, such as connection errors and timeouts
+        retries: `int`
+            The amount of requests that were retried
+        ratelimits: `int`
+            The amount of `429` responses
+        bytes_in: `int`
+            The total size of the response bodies, in bytes
+        bytes_out: `int`
+            The total size of the request bodies, in bytes
+        connect: `ciberedev.metrics.Histogram`
+            How long opening a connection took. Requests that reused a connection record `0`
+        ttfb: `ciberedev.metrics.Histogram`
+            How long the api took to send the response headers, after the connection was opened
+        read: `ciberedev.metrics.Histogram`
+            How long reading the response body took
+        total: `ciberedev.metrics.Histogram`
+            How long the whole request took
+        """
+
+        buckets = tuple(buckets)
+
+        self.route = route
+        self.requests = 0
+        self.statuses = {}
+        self.errors = 0
+        self.retries = 0
+        self.ratelimits = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.connect = Histogram(buckets)
+        self.ttfb = Histogram(buckets)
+        self.read = Histogram(buckets)
+        self.total = Histogram(buckets)
+
+    def __repr__(self) -> str:
+        return f"<RouteMetrics route={self.route!r} requests={self.requests} p99={self.total.percentile(0.99)}>"
+
+    def observe(
+        self,
+        *,
+        status: int,
+        connect: float,
+        ttfb: float,
+        read: float,
+        bytes_in: int,
+        bytes_out: int,
+    ) -> None:
+        """Records a request that got a response"""
+
+        self.requests += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.connect.observe(connect)
+        self.ttfb.observe(ttfb)
+        self.read.observe(read)
+        self.total.observe(connect + ttfb + read)
+
+    def observe_error(self) -> None:
+        """Records a request that failed without a response"""
+
+        self.requests += 1
+        self.errors += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Gives you a copy of the metrics as plain data
+
+        Returns
+        ----------
+        dict[str, Any]
+            the counters, and a summary of each latency histogram under `latency`
+        """
+
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "errors": self.errors,
+            "retries": self.retries,
+            "ratelimits": self.ratelimits,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "latency": {phase: getattr(self, phase).snapshot() for phase in PHASES},
+        }
+
+
+class Metrics:
+    buckets: tuple[float, ...]
+    routes: dict[str, RouteMetrics]
+
+    __slots__ = ["buckets", "routes"]
+
+    def __init__(self, *, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """Creates a metrics store, which records the requests a client sends to the api, per route
+
+        Every client records metrics, and they can be accessed via `ciberedev.client.Client.metrics`.
+        Only pass this to `ciberedev.client.Client` if you want custom histogram buckets, or want multiple clients to share one store.
+
+        Parameters
+        ----------
+        buckets: Iterable[`float`]
+            The upper bounds of the latency histogram buckets, in seconds. Defaults to 13 buckets between 5ms and 60s
+
+        Attributes
+        ----------
+        buckets: tuple[`float`]
+            The upper bounds of the latency histogram buckets, in seconds
+        routes: dict[`str`, `ciberedev.metrics.RouteMetrics`]
+            The metrics of each route, keyed by the route. Ex: `'/screenshot'`
+        """
+
+        self.buckets = tuple(sorted(buckets))
+        self.routes = {}
+
+    def __repr__(self) -> str:
+        return f"<Metrics routes={list(self.routes)}>"
+
+    def route(self, route: str) -> RouteMetrics:
+        """Gets the metrics of a route, creating them if needed
+
+        Parameters
+        ----------
+        route: `str`
+            the route. Ex: '/screenshot'
+
+        Returns
+        ----------
+        ciberedev.metrics.RouteMetrics
+            the route's metrics
+        """
+
+        try:
+            return self.routes[route]
+        except KeyError:
+            metrics = self.routes[route] = RouteMetrics(route, buckets=self.buckets)
+            return metrics
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Gives you a copy of every route's metrics as plain data
+
+        Returns
+        ----------
+        dict[str, dict[str, Any]]
+            the snapshot of each route, keyed by the route
+        """
+
+        return {route: metrics.snapshot() for route, metrics in self.routes.items()}
+
+    def reset(self) -> None:
+        """Removes every recorded metric"""
+
+        self.routes.clear()
+
+    def to_prometheus(self, *, namespace: str = "ciberedev") -> str:
+        """Exports the metrics in the Prometheus text format
+
+        Serve the result from your own `/metrics` endpoint to have Prometheus scrape it.
+
+        Parameters
+        ----------
+        namespace: `str`
+            the prefix of every metric's name. Defaults to `'ciberedev'`
+
+        Returns
+        ----------
+        str
+            the metrics in the Prometheus text exposition format
+        """
+
+        lines: list[str] = []
+
+        def counter(name: str, description: str, attr: str) -> None:
+            lines.append(f"# HELP {namespace}_{name} {description}")
+            lines.append(f"# TYPE {namespace}_{name} counter")
+            for route, metrics in self.routes.items():
+                lines.append(
+                    f'{namespace}_{name}{{route="{_escape(route)}"}} {getattr(metrics, attr)}'
+                )
+
+        name = f"{namespace}_responses_total"
+        lines.append(f"# HELP {name} The amount of responses, per status code")
+        lines.append(f"# TYPE {name} counter")
+        for route, metrics in self.routes.items():
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(
+                    f'{name}{{route="{_escape(route)}",status="{status}"}} {count}'
+                )
+
+        counter("requests_total", "The amount of requests sent", "requests")
+        counter(
+            "request_errors_total",
+            "The amount of requests that failed without a response",
+            "errors",
+        )
+        counter("retries_total", "The amount of retried requests", "retries")
+        counter("ratelimits_total", "The amount of 429 responses", "ratelimits")
+        counter(
+            "received_bytes_total",
+            "The total size of the response bodies",
+            "bytes_in",
+        )
+        counter("sent_bytes_total", "The total size of the request bodies", "bytes_out")
+
+        name = f"{namespace}_request_duration_seconds"
+        lines.append(f"# HELP {name} How long each phase of a request took")
+        lines.append(f"# TYPE {name} histogram")
+        for route, metrics in self.routes.items():
+            for phase in PHASES:
+                histogram: Histogram = getattr(metrics, phase)
+                labels = f'route="{_escape(route)}",phase="{phase}"'
+
+                cumulative = 0
+                for upper, count in zip(
+                    (*histogram.buckets, float("inf")), histogram.counts
+                ):
+                    cumulative += count
+                    lines.append(
+                        f'{name}_bucket{{{labels},le="{_format_le(upper)}"}} {cumulative}'
+                    )
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
+
+from .client import _add_image_param, _clean_screenshot_url, _clean_text_color
+from .file import File, StreamedFile
+from .timeouts import Timeout
+from .uploads import UploadSource
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .client import Client
+
+__all__ = ["Pipeline"]
+
+
+class Pipeline:
+    __slots__ = ["_client", "_source", "_steps"]
+
+    def __init__(
+        self, client: Client, fp: Optional[Union[str, UploadSource]] = None, /
+    ):
+        """A chain of image transforms, where each step is given the url of the previous step's image.
+
+        The intermediate images are never downloaded, only the final one is.
+        You should not be creating these yourself, use `ciberedev.client.Client.pipeline` instead.
+
+        Parameters
+        ----------
+        client: `ciberedev.client.Client`
+            the client the pipeline's requests are sent with
+        fp: Optional[Union[`str`, `bytes`, `os.PathLike`, `BinaryIO`, AsyncIterable[`bytes`], `ciberedev.file.File`]]
+            the url of the image the pipeline starts with, or the image itself. If not given, the pipeline has to start with `take_screenshot`
+        """
+
+        self._client = client
+        self._source: Optional[dict[str, Any]] = None
+        self._steps: list[tuple[str, dict[str, Any]]] = []
+
+        if fp is not None:
+            self._source = {}
+            _add_image_param(self._source, fp)
+
+    def __repr__(self) -> str:
+        return f"<Pipeline steps={[name for name, _ in self._steps]}>"
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def _add_step(self, name: str, params: dict[str, Any]) -> Self:
+        if not self._steps and self._source is None:
+            raise TypeError(
+                f"A pipeline without an image has to start with take_screenshot, not {name}"
+            )
+
+        self._steps.append((name, params))
+        return self
+
+    def take_screenshot(self, url: str, /, *, delay: int = 0) -> Self:
+        """Adds a step that takes a screenshot of the given url. This can only be the first step of a pipeline without an image
+
+        Parameters
+        ----------
+        url: `str`
+            The url you want to be screenshotted
+        delay: Optional[`int`]
+            The delay between going to the website, and taking the screenshot
+
+        Raises
+        ----------
+        TypeError
+            The pipeline already has an image, or the url or delay is invalid
+
+        Returns
+        ----------
+        ciberedev.pipeline.Pipeline
+            the pipeline, so calls can be chained
+        """
+
+        if self._steps or self._source is not None:
+            raise TypeError("take_screenshot can only be the first step of a pipeline")
+
+        self._steps.append(
+            (
+                "take_screenshot",
+                {"url": _clean_screenshot_url(url, delay), "delay": delay},
+            )
+        )
+        return self
+
+    def add_text_to_image(
+        self, text: str, /, *, text_color: Optional[tuple[int, int, int]] = None
+    ) -> Self:
+        """Adds a step that adds text to the image
+
+        Parameters
+        ----------
+        text: `str`
+            the text to be added
+        text_color: tuple[`int`, `int`, `int`]
+            the color to be added to the text
+
+        Raises
+        ----------
+        TypeError
+            The color is invalid, or the pipeline starts with uploaded bytes, which the api can not add text to
+
+        Returns
+        ----------
+        ciberedev.pipeline.Pipeline
+            the pipeline, so calls can be chained
+        """
+
+        if not self._steps and self._source is not None and "url" not in self._source:
+            raise TypeError("add_text_to_image only accepts an image url")
+
+        return self._add_step(
+            "add_text_to_image",
+            {"text": text, "color": _clean_text_color(text_color)},
+        )
+
+    def image_laugh(self, *, style: Optional[Literal[1, 2]] = None) -> Self:
+        """Adds a step that makes an image that laughs at the image
+
+        Parameters
+        ----------
+        style : `Literal[1, 2]`
+            the style of laugh
+
+        Returns
+        ----------
+        ciberedev.pipeline.Pipeline
+            the pipeline, so calls can be chained
+        """
+
+        return self._add_step("image_laugh", {"style": style or 2})
+
+    def invert_image(self) -> Self:
+        """Adds a step that inverts the image
+
+        Returns
+        ----------
+        ciberedev.pipeline.Pipeline
+            the pipeline, so calls can be chained
+        """
+
+        return self._add_step("invert_image", {})
+
+    @overload
+    async def run(
+        self,
+        *,
+        fetch: bool = ...,
+        stream: Literal[False] = ...,
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> File: ...
+
+    @overload
+    async def run(
+        self,
+        *,
+        fetch: bool = ...,
+        stream: Literal[True],
+        timeout: Optional[Union[float, Timeout]] = ...,
+        deadline: Optional[float] = ...,
+    ) -> StreamedFile: ...
+
+    async def run(
+        self,
+        *,
+        fetch: bool = True,
+        stream: bool = False,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Union[File, StreamedFile]:
+        """|coro|
+
+        Runs every step of the pipeline in order, and downloads the final image
+
+        The pipeline can be ran multiple times, unless its image is an async iterable or a file object that can not be seeked.
+
+        Parameters
+        ----------
+        fetch: `bool`
+            Whether to download the final image right away. If `False`, it is only downloaded once `ciberedev.file.File.read` is called. Defaults to `True`
+        stream: `bool`
+            Whether to return a `ciberedev.file.StreamedFile` instead of downloading the final image into memory. Defaults to `False`
+        timeout: Optional[Union[`float`, `ciberedev.timeouts.Timeout`]]
+            The timeout of the whole pipeline. A float only overrides the total timeout. Defaults to the client's timeout
+        deadline: Optional[`float`]
+            The `time.monotonic` timestamp the whole pipeline has to finish by. Defaults to no deadline
+
+        Raises
+        ----------
+        TypeError
+            The pipeline has no steps
+        UnableToConnect
+            If the api is unable to connect to the screenshotted website
+        UnknownError
+            The api has returned an unknown error
+        APIOffline
+            I could not connect to the api
+        RequestTimedOut
+            The pipeline did not finish before its timeout or deadline
+
+        Returns
+        ----------
+        Union[ciberedev.file.File, ciberedev.file.StreamedFile]
+            A file with the final image
+        """
+
+        if not self._steps:
+            raise TypeError("The pipeline has no steps")
+
+        return await self._client._http.with_timeout(
+            self._run(fetch, stream), timeout, deadline
+        )
+
+    async def _run(self, fetch: bool, stream: bool) -> Union[File, StreamedFile]:
+        http = self._client._http
+        image = self._source
+
+        for name, params in self._steps:
+            if name == "take_screenshot":
+                data = await http.take_screenshot(params["url"], params["delay"])
+            elif name == "add_text_to_image":
+                assert image is not None
+                data = await http.add_text_to_image(
+                    image["url"], params["text"], params["color"]
+                )
+            else:
+                data = await getattr(http, name)(**image, **params)
+
+            # the next step is given the link, so the api fetches the image itself instead of us
+            image = {"url": data["link"]}
+
+        assert image is not None
+        return await self._client._file_from_link(image["url"], stream, fetch)
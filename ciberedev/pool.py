@@ -0,0 +1,102 @@
+from typing import Optional
+
+from aiohttp import TCPConnector
+
+__all__ = ["PoolConfig"]
+
+
+class PoolConfig:
+    limit: int
+    limit_per_host: int
+    keepalive_timeout: float
+    ttl_dns_cache: Optional[int]
+    use_dns_cache: bool
+    prewarm: int
+
+    __slots__ = [
+        "limit",
+        "limit_per_host",
+        "keepalive_timeout",
+        "ttl_dns_cache",
+        "use_dns_cache",
+        "prewarm",
+    ]
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: Optional[int] = 300,
+        use_dns_cache: bool = True,
+        prewarm: int = 0,
+    ):
+        """Creates a connection pool config, which controls how the client's session connects to the api
+
+        Every request goes to the same host, so keeping connections alive for longer and caching DNS lookups
+        saves a TCP/TLS handshake and a DNS lookup on most requests.
+
+        Parameters
+        ----------
+        limit: `int`
+            The max amount of simultaneous connections. `0` means no limit. Defaults to `100`
+        limit_per_host: `int`
+            The max amount of simultaneous connections to a single host. `0` means no limit. Defaults to `0`
+        keepalive_timeout: `float`
+            How long, in seconds, an idle connection is kept open for reuse. Defaults to `15.0`
+        ttl_dns_cache: Optional[`int`]
+            How long, in seconds, resolved DNS entries are cached. `None` caches them forever. Defaults to `300`
+        use_dns_cache: `bool`
+            Whether DNS lookups should be cached or not. Defaults to `True`
+        prewarm: `int`
+            The amount of connections to open when the client is started, so the first burst of requests
+            does not have to open them one by one. Defaults to `0`
+
+        Attributes
+        ----------
+        limit: `int`
+            The max amount of simultaneous connections
+        limit_per_host: `int`
+            The max amount of simultaneous connections to a single host
+        keepalive_timeout: `float`
+            How long, in seconds, an idle connection is kept open for reuse
+        ttl_dns_cache: Optional[`int`]
+            How long, in seconds, resolved DNS entries are cached
+        use_dns_cache: `bool`
+            Whether DNS lookups are cached or not
+        prewarm: `int`
+            The amount of connections opened when the client is started
+        """
+
+        if prewarm < 0:
+            raise TypeError("prewarm can not be in the negatives")
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.use_dns_cache = use_dns_cache
+        self.prewarm = prewarm
+
+    def __repr__(self) -> str:
+        return f"<PoolConfig limit={self.limit} limit_per_host={self.limit_per_host} prewarm={self.prewarm}>"
+
+    def create_connector(self) -> TCPConnector:
+        """Creates an `aiohttp.TCPConnector` with this config.
+
+        This has to be called inside of a running event loop
+
+        Returns
+        ----------
+        aiohttp.TCPConnector
+            the connector
+        """
+
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.use_dns_cache,
+        )
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+
+from .file import File
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = ["ProcessingPool"]
+
+T = TypeVar("T")
+
+
+def _run_in_worker(func: Callable[[memoryview], T], name: str, size: int) -> T:
+    shm = SharedMemory(name=name)
+    try:
+        view = shm.buf[:size].toreadonly()
+        try:
+            return func(view)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+class ProcessingPool:
+    max_workers: Optional[int]
+    _executor: Optional[ProcessPoolExecutor]
+    _pending: set[Future]
+
+    __slots__ = ["max_workers", "_executor", "_pending"]
+
+    def __init__(self, *, max_workers: Optional[int] = None):
+        """Creates a pool of worker processes, which post-process the images the client downloads
+
+        Decoding or resizing an image on the event loop's thread stalls every other request,
+        so the work is done in other processes instead. The image is handed to the worker through shared memory,
+        so it is copied once instead of being pickled and sent through a pipe.
+
+        The worker processes are only started once the first image is processed.
+
+        Parameters
+        ----------
+        max_workers: Optional[`int`]
+            The max amount of worker processes. Defaults to the amount of CPUs
+
+        Attributes
+        ----------
+        max_workers: Optional[`int`]
+            The max amount of worker processes
+        """
+
+        if max_workers is not None and max_workers < 1:
+            raise TypeError("max_workers must be atleast 1")
+
+        self.max_workers = max_workers
+        self._executor = None
+        self._pending = set()
+
+    def __repr__(self) -> str:
+        return f"<ProcessingPool max_workers={self.max_workers} started={self._executor is not None}>"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback) -> None:
+        self.close()
+
+    async def process(self, file: File, func: Callable[[memoryview], T], /) -> T:
+        """|coro|
+
+        Runs a function on the bytes of a file in a worker process
+
+        Parameters
+        ----------
+        file: `ciberedev.file.File`
+            the file. If it has not been fetched yet, it is downloaded first
+        func: Callable[[`memoryview`], `Any`]
+            the function. It is given a read-only view of the file's bytes, which must not be used after it returns,
+            and its result is sent back to the client. The function has to be picklable, so it must be defined at the top level of a module
+
+        Raises
+        ----------
+        Exception
+            Anything the function raised
+
+        Returns
+        ----------
+        Any
+            what the function returned
+        """
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        if file._view is None:
+            # downloads or reads the file, without copying files that are already in memory
+            await file.read()
+
+        view = file.view
+        size = len(view)
+
+        # shared memory can't be empty, so empty files still get a byte
+        shm = SharedMemory(create=True, size=max(size, 1))
+        try:
+            shm.buf[:size] = view
+            future = self._executor.submit(_run_in_worker, func, shm.name, size)
+            # tracked so close can cancel it, since `shutdown(cancel_futures=True)` needs python 3.9
+            self._pending.add(future)
+            future.add_done_callback(self._pending.discard)
+            return await asyncio.wrap_future(future)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def close(self, *, wait: bool = True) -> None:
+        """Stops the worker processes
+
+        Parameters
+        ----------
+        wait: `bool`
+            Whether to wait for the images being processed to finish. Defaults to `True`
+        """
+
+        if self._executor is not None:
+            if not wait:
+                # images that are already being processed can't be cancelled, and are left to finish
+                for future in list(self._pending):
+                    future.cancel()
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from multidict import CIMultiDictProxy
+
+__all__ = []
+
+DEFAULT_RETRY_AFTER = 5.0
+
+
+def _get_float(headers: CIMultiDictProxy[str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_retry_after(headers: CIMultiDictProxy[str]) -> float:
+    """Returns the amount of seconds the `Retry-After` header tells us to wait.
+
+    The header can either be a delay in seconds or an HTTP date. If it is missing or
+    can not be parsed, `DEFAULT_RETRY_AFTER` is returned.
+    """
+
+    value = headers.get("Retry-After")
+    if value is None:
+        reset_after = _get_float(headers, "X-RateLimit-Reset-After", "RateLimit-Reset")
+        return DEFAULT_RETRY_AFTER if reset_after is None else max(reset_after, 0.0)
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+class Bucket:
+    """A ratelimit bucket for a single route.
+
+    Every request made to the route has to go through `Bucket.acquire` first. The
+    bucket keeps track of the ratelimit headers the api sends back, and uses them to
+    space requests out evenly over the ratelimit window, so that we rarely hit a 429.
+    When we do get ratelimited, the bucket gets locked until the ratelimit resets, and
+    every caller waits on that instead of retrying on their own.
+    """
+
+    key: str
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset_at: Optional[float]
+
+    __slots__ = [
+        "key",
+        "limit",
+        "remaining",
+        "reset_at",
+        "_lock",
+        "_unlocked",
+        "_next_request",
+    ]
+
+    def __init__(self, key: str):
+        self.key = key
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None
+
+        self._lock = asyncio.Lock()
+        self._unlocked = asyncio.Event()
+        self._unlocked.set()
+        self._next_request = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<Bucket key={self.key!r} remaining={self.remaining} limit={self.limit}>"
+        )
+
+    @property
+    def is_locked(self) -> bool:
+        return not self._unlocked.is_set()
+
+    async def acquire(self) -> None:
+        """Waits until a request can be sent to this bucket's route"""
+
+        await self._unlocked.wait()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if self.reset_at is not None and now >= self.reset_at:
+                    self.remaining = self.limit
+                    self.reset_at = None
+
+                wait = self._next_request - now
+                if self.remaining == 0 and self.reset_at is not None:
+                    wait = max(wait, self.reset_at - now)
+                if wait <= 0:
+                    break
+
+                await asyncio.sleep(wait)
+
+            if self.remaining:
+                self.remaining -= 1
+
+            if self.remaining and self.reset_at is not None:
+                # spread whats left of the window evenly between the remaining requests
+                self._next_request = now + (self.reset_at - now) / (self.remaining + 1)
+            else:
+                self._next_request = now
+
+    def update(self, headers: CIMultiDictProxy[str]) -> None:
+        """Updates the bucket with the ratelimit headers of a response"""
+
+        limit = _get_float(headers, "X-RateLimit-Limit", "RateLimit-Limit")
+        remaining = _get_float(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        self.remaining = int(remaining)
+        if limit is not None:
+            self.limit = int(limit)
+
+        reset_after = _get_float(headers, "X-RateLimit-Reset-After", "RateLimit-Reset")
+        if reset_after is None:
+            reset = _get_float(headers, "X-RateLimit-Reset")
+            if reset is not None:
+                reset_after = reset - time.time()
+
+        if reset_after is not None:
+            self.reset_at = time.monotonic() + max(reset_after, 0.0)
+
+    def ratelimited(self, retry_after: float) -> bool:
+        """Locks the bucket for `retry_after` seconds.
+
+        Returns `True` if this call locked the bucket, and `False` if it was already
+        locked by another request.
+        """
+
+        self.remaining = 0
+        self.reset_at = time.monotonic() + retry_after
+
+        if self.is_locked:
+            return False
+
+        self._unlocked.clear()
+        asyncio.get_running_loop().call_later(retry_after, self._unlocked.set)
+        return True
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Iterable, Optional
+
+from aiohttp.client_exceptions import ClientConnectionError
+
+__all__ = ["RetryPolicy"]
+
+DEFAULT_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+DEFAULT_RETRY_EXCEPTIONS = (ClientConnectionError, asyncio.TimeoutError)
+
+
+class RetryPolicy:
+    max_retries: int
+    base_delay: float
+    max_delay: float
+    statuses: frozenset[int]
+    exceptions: tuple[type[BaseException], ...]
+    budget: float
+    budget_refill_rate: float
+    deadline: Optional[float]
+
+    __slots__ = [
+        "max_retries",
+        "base_delay",
+        "max_delay",
+        "statuses",
+        "exceptions",
+        "budget",
+        "budget_refill_rate",
+        "deadline",
+        "_tokens",
+        "_last_refill",
+    ]
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        exceptions: Iterable[type[BaseException]] = DEFAULT_RETRY_EXCEPTIONS,
+        budget: float = 10.0,
+        budget_refill_rate: float = 0.5,
+        deadline: Optional[float] = None,
+    ):
+        """Creates a retry policy, which decides when and how failed requests are retried
+
+        Retries are delayed using exponential backoff with full jitter, so clients that failed at the same time
+        don't all retry at the same time. Every retry also takes a token from a retry budget, which refills over time,
+        so an outage can't turn into a flood of retries.
+
+        Parameters
+        ----------
+        max_retries: `int`
+            The max amount of times a single request is retried. Defaults to `3`
+        base_delay: `float`
+            The delay, in seconds, the backoff starts at. Defaults to `0.5`
+        max_delay: `float`
+            The max delay, in seconds, between two attempts. Defaults to `30.0`
+        statuses: Iterable[`int`]
+            The status codes that are retried. Defaults to `500`, `502`, `503` and `504`
+        exceptions: Iterable[Type[`BaseException`]]
+            The exceptions that are retried. Defaults to `aiohttp.ClientConnectionError` and `asyncio.TimeoutError`
+        budget: `float`
+            The max amount of retries that can be made in a burst. Defaults to `10.0`
+        budget_refill_rate: `float`
+            How many retries are added back to the budget every second. Defaults to `0.5`
+        deadline: Optional[`float`]
+            The max amount of time, in seconds, a request can take including all of its retries. Defaults to no limit
+
+        Attributes
+        ----------
+        max_retries: `int`
+            The max amount of times a single request is retried
+        base_delay: `float`
+            The delay, in seconds, the backoff starts at
+        max_delay: `float`
+            The max delay, in seconds, between two attempts
+        statuses: frozenset[`int`]
+            The status codes that are retried
+        exceptions: tuple[Type[`BaseException`]]
+            The exceptions that are retried
+        budget: `float`
+            The max amount of retries that can be made in a burst
+        budget_refill_rate: `float`
+            How many retries are added back to the budget every second
+        deadline: Optional[`float`]
+            The max amount of time, in seconds, a request can take including all of its retries
+        """
+
+        if max_retries < 0:
+            raise TypeError("max_retries can not be in the negatives")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+        self.exceptions = tuple(exceptions)
+        self.budget = budget
+        self.budget_refill_rate = budget_refill_rate
+        self.deadline = deadline
+
+        self._tokens = budget
+        self._last_refill = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<RetryPolicy max_retries={self.max_retries} statuses={sorted(self.statuses)}>"
+
+    @property
+    def remaining_budget(self) -> float:
+        """The amount of retries currently left in the retry budget"""
+
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.budget,
+            self._tokens + (now - self._last_refill) * self.budget_refill_rate,
+        )
+        self._last_refill = now
+
+    def backoff(self, retry: int) -> float:
+        """Gives you how long to wait before the given retry
+
+        Parameters
+        ----------
+        retry: `int`
+            the retry, starting at `0`
+
+        Returns
+        ----------
+        float
+            the delay in seconds, picked at random between `0` and the exponential backoff
+        """
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+    def get_delay(self, retry: int, elapsed: float) -> Optional[float]:
+        """Decides if a request should be retried, and how long to wait before doing so
+
+        Parameters
+        ----------
+        retry: `int`
+            the retry, starting at `0`
+        elapsed: `float`
+            how long, in seconds, the request has taken so far
+
+        Returns
+        ----------
+        Optional[float]
+            the delay in seconds, or `None` if the request should not be retried
+        """
+
+        if retry >= self.max_retries:
+            return None
+
+        delay = self.backoff(retry)
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+
+        self._refill()
+        if self._tokens < 1:
+            return None
+
+        self._tokens -= 1
+        return delay
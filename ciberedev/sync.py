@@ -0,0 +1,506 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .cache import DiskCache, ResponseCache
+from .circuitbreaker import CircuitBreaker, CircuitState
+from .client import Client
+from .endpoints import LoadBalancer
+from .errors import ClientAlreadyClosed
+from .file import File
+from .metrics import Metrics
+from .pipeline import Pipeline
+from .processing import ProcessingPool
+from .retries import RetryPolicy
+from .searching import SearchResult
+from .timeouts import Timeout
+from .uploads import UploadSource
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = ["SyncClient"]
+
+T = TypeVar("T")
+
+
+class SyncClient:
+    _client: Client
+    _loop: asyncio.AbstractEventLoop
+    _thread: threading.Thread
+    _closed: bool
+
+    __slots__ = ["_client", "_loop", "_thread", "_closed", "_lock"]
+
+    def __init__(self, client: Optional[Client] = None, /, **kwargs: Any):
+        """Lets you use the client from code that is not async, such as WSGI apps
+
+        The client, its session and its connection pool live on an event loop that runs in a background thread,
+        and every method blocks until its request is done. A single sync client is thread-safe, so it can be shared
+        between every thread of your app, and they all reuse the same connections.
+
+        Only call `close` once you are done with it, since it stops the background thread.
+
+        Parameters
+        ----------
+        client: Optional[`ciberedev.client.Client`]
+            the client to run in the background. Use this if you subclassed `ciberedev.client.Client`, to override its hooks for example.
+            Can not be used with any other kwargs
+        **kwargs: `Any`
+            the kwargs the client is created with. See `ciberedev.client.Client` for the available kwargs
+        """
+
+        if client is not None and kwargs:
+            raise TypeError("kwargs can not be used with a custom client")
+
+        self._client = client or Client(**kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="ciberedev-sync-client", daemon=True
+        )
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        return f"<SyncClient closed={self._closed}>"
+
+    def __enter__(self) -> Self:
+        self.prewarm()
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback) -> None:
+        self.close()
+
+    @property
+    def client(self) -> Client:
+        """The async client that runs in the background. Its coroutines have to be ran with `ciberedev.sync.SyncClient.run`"""
+
+        return self._client
+
+    @property
+    def latency(self) -> Optional[float]:
+        """The latency between the client and the api. See `ciberedev.client.Client.latency`"""
+
+        return self._client.latency
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """The response cache the client is using, if any"""
+
+        return self._client.cache
+
+    @property
+    def disk_cache(self) -> Optional[DiskCache]:
+        """The on-disk image cache the client is using, if any"""
+
+        return self._client.disk_cache
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """The retry policy the client is using"""
+
+        return self._client.retry_policy
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """The circuit breaker the client is using, if any"""
+
+        return self._client.circuit_breaker
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """The state of the client's circuit breaker. See `ciberedev.client.Client.circuit_state`"""
+
+        return self._client.circuit_state
+
+    @property
+    def timeout(self) -> Timeout:
+        """The default timeout of the client's calls"""
+
+        return self._client.timeout
+
+    @property
+    def base_url(self) -> str:
+        """The base url of the api. See `ciberedev.client.Client.base_url`"""
+
+        return self._client.base_url
+
+    @property
+    def load_balancer(self) -> Optional[LoadBalancer]:
+        """The load balancer the client is using, if any"""
+
+        return self._client.load_balancer
+
+    @property
+    def processing_pool(self) -> ProcessingPool:
+        """The worker processes the `process` functions of the image methods are ran in"""
+
+        return self._client.processing_pool
+
+    @property
+    def metrics(self) -> Metrics:
+        """The per-route request metrics of the client. See `ciberedev.client.Client.metrics`"""
+
+        return self._client.metrics
+
+    @property
+    def requests(self) -> int:
+        """The amount of requests sent to the api during the programs lifetime"""
+
+        return self._client.requests
+
+    def is_closed(self) -> bool:
+        """Returns a bool depending on if the client has been closed or not
+
+        Returns
+        ----------
+        bool
+            True if the client is closed, False if its not been closed
+        """
+
+        return self._closed
+
+    def run(self, coro: Awaitable[T], /) -> T:
+        """Runs a coroutine on the client's event loop, and waits for its result
+
+        This can be used to run anything the sync client does not wrap itself. Ex: `sync_client.run(sync_client.pipeline().invert_image().run())`
+
+        Parameters
+        ----------
+        coro: Awaitable[`Any`]
+            the coroutine
+
+        Raises
+        ----------
+        ClientAlreadyClosed
+            The client has been closed
+        RuntimeError
+            This was called from the client's background thread, such as from one of its hooks, which would deadlock
+
+        Returns
+        ----------
+        Any
+            the result of the coroutine
+        """
+
+        if self._closed or threading.current_thread() is self._thread:
+            if asyncio.iscoroutine(coro):
+                coro.close()
+            if self._closed:
+                raise ClientAlreadyClosed()
+            raise RuntimeError(
+                "SyncClient methods can not be called from the client's own thread, await the client's coroutines instead"
+            )
+
+        async def wrapper() -> T:
+            return await coro
+
+        return asyncio.run_coroutine_threadsafe(wrapper(), self._loop).result()
+
+    def prewarm(self, connections: Optional[int] = None) -> None:
+        """Opens connections to the api ahead of time. See `ciberedev.client.Client.prewarm`
+
+        This is automatically called when the client is used as a context manager
+        """
+
+        self.run(self._client.prewarm(connections))
+
+    def close(self) -> None:
+        """Closes the client's session, and stops its background thread
+
+        Raises
+        ----------
+        ClientAlreadyClosed
+            This is raised when you already closed the client
+        """
+
+        with self._lock:
+            if self._closed:
+                raise ClientAlreadyClosed()
+
+            try:
+                self.run(self._client.close())
+            finally:
+                self._closed = True
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+
+    def take_screenshot(
+        self,
+        url: str,
+        /,
+        *,
+        delay: int = 0,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> File:
+        """Takes a screenshot of the given url. See `ciberedev.client.Client.take_screenshot`
+
+        Returns
+        ----------
+        ciberedev.file.File
+            A file object of your screenshot
+        """
+
+        return self.run(
+            self._client.take_screenshot(
+                url, delay=delay, process=process, timeout=timeout, deadline=deadline
+            )
+        )
+
+    def take_screenshots(
+        self,
+        urls: Iterable[str],
+        /,
+        *,
+        delay: int = 0,
+        concurrency: int = 8,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[tuple[str, Union[File, Exception]]]:
+        """Takes a screenshot of each of the given urls, `concurrency` at a time. See `ciberedev.client.Client.take_screenshots`
+
+        `urls` is iterated on the client's background thread, so it should not block
+
+        Yields
+        ----------
+        tuple[`str`, Union[ciberedev.file.File, `Exception`]]
+            The url, and either a file object of its screenshot or the error raised while taking it, in the order they complete
+        """
+
+        screenshots = self._client.take_screenshots(
+            urls,
+            delay=delay,
+            concurrency=concurrency,
+            process=process,
+            timeout=timeout,
+            deadline=deadline,
+        )
+        try:
+            while True:
+                try:
+                    yield self.run(screenshots.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closed:
+                self.run(screenshots.aclose())
+
+    def get_search_results(
+        self,
+        query: str,
+        /,
+        *,
+        amount: int = 5,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> list[SearchResult]:
+        """Searches the web with the given query. See `ciberedev.client.Client.get_search_results`
+
+        Returns
+        ----------
+        List[ciberedev.searching.SearchResult]
+            A list of your search results
+        """
+
+        return self.run(
+            self._client.get_search_results(
+                query, amount=amount, timeout=timeout, deadline=deadline
+            )
+        )
+
+    def iter_search_results(
+        self,
+        query: str,
+        /,
+        *,
+        limit: Optional[int] = None,
+        page_size: int = 10,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[SearchResult]:
+        """Searches the web with the given query, yielding the results as they arrive. See `ciberedev.client.Client.iter_search_results`
+
+        Yields
+        ----------
+        ciberedev.searching.SearchResult
+            The next search result
+        """
+
+        results = self._client.iter_search_results(
+            query, limit=limit, page_size=page_size, timeout=timeout, deadline=deadline
+        )
+        try:
+            while True:
+                try:
+                    yield self.run(results.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closed:
+                self.run(results.aclose())
+
+    def get_random_words(
+        self,
+        amount: int,
+        /,
+        *,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> list[str]:
+        """Gives you random words. See `ciberedev.client.Client.get_random_words`
+
+        Returns
+        ----------
+        List[`str`]
+            the random words that have been generated
+        """
+
+        return self.run(
+            self._client.get_random_words(amount, timeout=timeout, deadline=deadline)
+        )
+
+    def convert_image_to_ascii(
+        self,
+        url: str,
+        /,
+        *,
+        width: Optional[int] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> str:
+        """Converts the given image to ascii art. See `ciberedev.client.Client.convert_image_to_ascii`
+
+        Returns
+        ----------
+        str
+            the ascii art
+        """
+
+        return self.run(
+            self._client.convert_image_to_ascii(
+                url, width=width, timeout=timeout, deadline=deadline
+            )
+        )
+
+    def add_text_to_image(
+        self,
+        *,
+        image_url: str,
+        text: str,
+        text_color: Optional[tuple[int, int, int]] = None,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> File:
+        """Adds text to a given image. See `ciberedev.client.Client.add_text_to_image`
+
+        Returns
+        ----------
+        ciberedev.file.File
+            A file with the new image
+        """
+
+        return self.run(
+            self._client.add_text_to_image(
+                image_url=image_url,
+                text=text,
+                text_color=text_color,
+                process=process,
+                timeout=timeout,
+                deadline=deadline,
+            )
+        )
+
+    def image_laugh(
+        self,
+        fp: Union[str, UploadSource],
+        /,
+        *,
+        style: Optional[Literal[1, 2]] = None,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> File:
+        """Makes an image that laughs at the given image. See `ciberedev.client.Client.image_laugh`
+
+        Returns
+        ----------
+        ciberedev.file.File
+            A file with the new image
+        """
+
+        return self.run(
+            self._client.image_laugh(
+                fp, style=style, process=process, timeout=timeout, deadline=deadline
+            )
+        )
+
+    def invert_image(
+        self,
+        fp: Union[str, UploadSource],
+        /,
+        *,
+        process: Optional[Callable[[memoryview], Any]] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> File:
+        """Inverts an image. See `ciberedev.client.Client.invert_image`
+
+        Returns
+        ----------
+        ciberedev.file.File
+            A file with the new image
+        """
+
+        return self.run(
+            self._client.invert_image(
+                fp, process=process, timeout=timeout, deadline=deadline
+            )
+        )
+
+    def pipeline(self, fp: Optional[Union[str, UploadSource]] = None, /) -> Pipeline:
+        """Creates a pipeline. See `ciberedev.client.Client.pipeline`
+
+        The pipeline has to be ran with `ciberedev.sync.SyncClient.run`. Ex: `sync_client.run(pipeline.run())`
+
+        Returns
+        ----------
+        ciberedev.pipeline.Pipeline
+            the pipeline
+        """
+
+        return self._client.pipeline(fp)
+
+    def ping(
+        self,
+        *,
+        timeout: Optional[Union[float, Timeout]] = None,
+        deadline: Optional[float] = None,
+    ) -> float:
+        """Pings the api. See `ciberedev.client.Client.ping`
+
+        Returns
+        ----------
+        float
+            the latency. Multiply by 1000 to convert to ms
+        """
+
+        return self.run(self._client.ping(timeout=timeout, deadline=deadline))
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+from aiohttp import web
+
+from .client import Client
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = ["MockServer"]
+
+WORDS = ("apple", "river", "cloud", "stone", "light", "paper", "music", "glass")
+
+
+class MockServer:
+    latency: float
+    jitter: float
+    failures: dict[int, float]
+    retry_after: float
+    image_size: int
+    max_results: int
+    requests: dict[str, int]
+
+    __slots__ = [
+        "latency",
+        "jitter",
+        "failures",
+        "retry_after",
+        "image_size",
+        "max_results",
+        "requests",
+        "_host",
+        "_port",
+        "_random",
+        "_image",
+        "_images",
+        "_runner",
+        "_url",
+    ]
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failures: Optional[Mapping[int, float]] = None,
+        retry_after: float = 0.0,
+        image_size: int = 64 * 1024,
+        max_results: int = 100,
+        seed: Optional[int] = None,
+    ):
+        """Creates a local stand-in for the api, which can be used to test or load-test a client without sending requests to the real api
+
+        It emulates `/screenshot`, `/search`, `/random/word`, `/image/*` and `/ping`, and serves the images it links to.
+        Every image is the same `image_size` bytes, so no real images are made.
+
+        Parameters
+        ----------
+        host: `str`
+            The host the server listens on. Defaults to `'127.0.0.1'`
+        port: `int`
+            The port the server listens on. `0` picks a free port. Defaults to `0`
+        latency: `float`
+            How long, in seconds, the server waits before answering an api request. Defaults to `0.0`
+        jitter: `float`
+            The max amount of seconds randomly added to `latency`. Defaults to `0.0`
+        failures: Optional[Mapping[`int`, `float`]]
+            The chance of an api request failing with each status code, between `0` and `1`. Ex: `{429: 0.05, 502: 0.01}`
+        retry_after: `float`
+            The `Retry-After` header of `429` responses, in seconds. Defaults to `0.0`
+        image_size: `int`
+            The size of the images the server links to, in bytes. Defaults to 64KiB
+        max_results: `int`
+            The max amount of search results the server gives. Defaults to `100`
+        seed: Optional[`int`]
+            The seed of the random number generator, so failures and jitter can be reproduced
+
+        Attributes
+        ----------
+        latency: `float`
+            How long, in seconds, the server waits before answering an api request
+        jitter: `float`
+            The max amount of seconds randomly added to `latency`
+        failures: dict[`int`, `float`]
+            The chance of an api request failing with each status code
+        retry_after: `float`
+            The `Retry-After` header of `429` responses, in seconds
+        image_size: `int`
+            The size of the images the server links to, in bytes
+        max_results: `int`
+            The max amount of search results the server gives
+        requests: dict[`str`, `int`]
+            The amount of requests the server has received, per path
+        """
+
+        if sum((failures or {}).values()) > 1:
+            raise TypeError("The chances of the failures can not add up to more than 1")
+
+        self.latency = latency
+        self.jitter = jitter
+        self.failures = dict(failures or {})
+        self.retry_after = retry_after
+        self.image_size = image_size
+        self.max_results = max_results
+        self.requests = {}
+        self._host = host
+        self._port = port
+        self._random = random.Random(seed)
+        self._image = b""
+        self._images = 0
+        self._runner: Optional[web.AppRunner] = None
+        self._url: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<MockServer url={self._url} latency={self.latency}>"
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self, exception_type, exception_value, exception_traceback
+    ) -> None:
+        await self.close()
+
+    @property
+    def url(self) -> str:
+        """The base url of the server. Ex: `'http://127.0.0.1:8080'`
+
+        Raises
+        ----------
+        RuntimeError
+            The server has not been started
+        """
+
+        if self._url is None:
+            raise RuntimeError("The server has not been started")
+        return self._url
+
+    def client(self, **kwargs: Any) -> Client:
+        """Creates a client that sends its requests to this server
+
+        Parameters
+        ----------
+        **kwargs: `Any`
+            the kwargs the client is created with. See `ciberedev.client.Client` for the available kwargs
+
+        Raises
+        ----------
+        RuntimeError
+            The server has not been started
+
+        Returns
+        ----------
+        ciberedev.client.Client
+            the client
+        """
+
+        return Client(base_url=self.url, **kwargs)
+
+    async def start(self) -> None:
+        """|coro|
+
+        Starts the server
+
+        Raises
+        ----------
+        RuntimeError
+            The server has already been started
+        """
+
+        if self._runner is not None:
+            raise RuntimeError("The server has already been started")
+
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/screenshot", self._link)
+        app.router.add_get("/search", self._search)
+        app.router.add_get("/random/word", self._random_words)
+        app.router.add_get("/image/ascii", self._ascii)
+        app.router.add_route("*", "/image/add-text", self._link)
+        app.router.add_route("*", "/image/laugh", self._link)
+        app.router.add_route("*", "/image/invert", self._link)
+        app.router.add_get("/ping", self._ping)
+        app.router.add_get("/images/{name}", self._get_image)
+
+        self._image = bytes(range(256)) * (self.image_size // 256) + bytes(
+            self.image_size % 256
+        )
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+
+        host, port = self._runner.addresses[0][:2]
+        self._url = f"http://{host}:{port}"
+
+    async def close(self) -> None:
+        """|coro|
+
+        Stops the server
+        """
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._url = None
+
+    def _pick_failure(self) -> Optional[int]:
+        roll = self._random.random()
+        for status, chance in self.failures.items():
+            if roll < chance:
+                return status
+            roll -= chance
+        return None
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        is_image = request.path.startswith("/images/")
+        path = "/images" if is_image else request.path
+        self.requests[path] = self.requests.get(path, 0) + 1
+
+        # images are served by a cdn, not the api, so they are never slowed down or failed
+        if is_image:
+            return await handler(request)
+
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # the body is always read, like a real server, so uploads are fully sent
+        await request.read()
+
+        status = self._pick_failure()
+        if status is None:
+            return await handler(request)
+        if status == 429:
+            return web.json_response(
+                {"error": "You are being ratelimited", "status_code": status},
+                status=status,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        return web.json_response(
+            {"error": "Injected failure", "status_code": status}, status=status
+        )
+
+    def _new_link(self) -> str:
+        self._images += 1
+        return f"{self.url}/images/{self._images}.png"
+
+    async def _link(self, request: web.Request) -> web.Response:
+        return web.json_response({"link": self._new_link(), "status_code": 200})
+
+    async def _search(self, request: web.Request) -> web.Response:
+        query = request.query.get("query", "")
+        amount = min(int(request.query.get("amount", 5)), self.max_results)
+        results = [
+            {
+                "title": f"{query} result {i}",
+                "description": f"The description of result {i}",
+                "url": f"https://example.com/{i}",
+            }
+            for i in range(amount)
+        ]
+        return web.json_response({"results": results, "status_code": 200})
+
+    async def _random_words(self, request: web.Request) -> web.Response:
+        amount = int(request.query.get("amount", 1))
+        words = [self._random.choice(WORDS) for _ in range(amount)]
+        return web.json_response({"words": words, "status_code": 200})
+
+    async def _ascii(self, request: web.Request) -> web.Response:
+        width = int(request.query.get("width", 32))
+        art = "\n".join("#" * width for _ in range(width // 2))
+        return web.json_response({"msg": art, "status_code": 200})
+
+    async def _ping(self, request: web.Request) -> web.Response:
+        return web.json_response({"status_code": 200})
+
+    async def _get_image(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._image, content_type="image/png")
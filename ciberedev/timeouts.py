@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Iterator, Optional, Union
+
+from aiohttp import ClientTimeout
+
+__all__ = ["Timeout"]
+
+
+class Timeout:
+    total: Optional[float]
+    connect: Optional[float]
+    read: Optional[float]
+
+    __slots__ = ["total", "connect", "read"]
+
+    def __init__(
+        self,
+        *,
+        total: Optional[float] = 120.0,
+        connect: Optional[float] = 10.0,
+        read: Optional[float] = 60.0,
+    ):
+        """Creates a timeout config
+
+        Parameters
+        ----------
+        total: Optional[`float`]
+            The max amount of time, in seconds, a whole method call can take, including retries and downloading the image. Defaults to `120.0`
+        connect: Optional[`float`]
+            The max amount of time, in seconds, opening a connection can take. Defaults to `10.0`
+        read: Optional[`float`]
+            The max amount of time, in seconds, to wait for the api to send more data. Defaults to `60.0`
+
+        Attributes
+        ----------
+        total: Optional[`float`]
+            The max amount of time, in seconds, a whole method call can take, including retries and downloading the image
+        connect: Optional[`float`]
+            The max amount of time, in seconds, opening a connection can take
+        read: Optional[`float`]
+            The max amount of time, in seconds, to wait for the api to send more data
+        """
+
+        self.total = total
+        self.connect = connect
+        self.read = read
+
+    def __repr__(self) -> str:
+        return f"<Timeout total={self.total} connect={self.connect} read={self.read}>"
+
+    @classmethod
+    def resolve(
+        cls, timeout: Optional[Union[float, Timeout]], default: Timeout
+    ) -> Timeout:
+        """Turns a timeout kwarg into a `Timeout`
+
+        A float only overrides the total timeout, and `None` means the default is used
+        """
+
+        if timeout is None:
+            return default
+        if isinstance(timeout, Timeout):
+            return timeout
+        return cls(total=timeout, connect=default.connect, read=default.read)
+
+
+_timeout: ContextVar[Optional[Timeout]] = ContextVar("ciberedev_timeout", default=None)
+_deadline: ContextVar[Optional[float]] = ContextVar("ciberedev_deadline", default=None)
+
+
+def current_deadline() -> Optional[float]:
+    return _deadline.get()
+
+
+def unscoped_context() -> Context:
+    """Copies the current context without its timeout scope
+
+    Tasks shared by multiple callers are started in this, so they are not cut short by the timeout of whichever caller started them.
+    Each caller applies its own timeout while waiting on the task instead.
+    """
+
+    context = copy_context()
+    context.run(_timeout.set, None)
+    context.run(_deadline.set, None)
+    return context
+
+
+@contextmanager
+def timeout_scope(
+    timeout: Timeout, deadline: Optional[float] = None
+) -> Iterator[Optional[float]]:
+    """Applies a timeout to everything inside of it, yielding the `time.monotonic` deadline.
+
+    Nested scopes can only make the deadline earlier, never later.
+    """
+
+    deadlines = [d for d in (deadline, _deadline.get()) if d is not None]
+    if timeout.total is not None:
+        deadlines.append(time.monotonic() + timeout.total)
+    resolved = min(deadlines) if deadlines else None
+
+    timeout_token = _timeout.set(timeout)
+    deadline_token = _deadline.set(resolved)
+    try:
+        yield resolved
+    finally:
+        _deadline.reset(deadline_token)
+        _timeout.reset(timeout_token)
+
+
+def get_client_timeout(default: Timeout) -> Optional[ClientTimeout]:
+    """Creates the `aiohttp.ClientTimeout` for a single request in the current scope
+
+    Returns `None` if the scope's deadline has already passed
+    """
+
+    timeout = _timeout.get() or default
+    deadline = _deadline.get()
+
+    if deadline is None:
+        total = timeout.total
+    else:
+        total = deadline - time.monotonic()
+        if total <= 0:
+            return None
+
+    return ClientTimeout(
+        total=total, sock_connect=timeout.connect, sock_read=timeout.read
+    )
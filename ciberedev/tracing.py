@@ -0,0 +1,520 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Hashable, Literal, Optional
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceRequestChunkSentParams,
+    TraceRequestStartParams,
+)
+
+__all__ = [
+    "RequestStartEvent",
+    "RequestEndEvent",
+    "RetryEvent",
+    "CacheHitEvent",
+    "ImageDownloadedEvent",
+    "OpenTelemetryTracer",
+]
+
+HOOKS = ("request_start", "request_end", "retry", "cache_hit", "image_downloaded")
+
+
+class RequestStartEvent:
+    method: str
+    url: str
+    route: str
+    attempt: int
+    started_at: float
+
+    __slots__ = ["method", "url", "route", "attempt", "started_at"]
+
+    def __init__(
+        self, *, method: str, url: str, route: str, attempt: int, started_at: float
+    ):
+        """Passed to `ciberedev.client.Client.on_request_start`. You should not be creating these yourself
+
+        Attributes
+        ----------
+        method: `str`
+            the request's method. Ex: 'GET'
+        url: `str`
+            the request's url, including the query string
+        route: `str`
+            the api route. Ex: '/screenshot'
+        attempt: `int`
+            the attempt, starting at `1`. Retries and ratelimited requests are sent again as a new attempt
+        started_at: `float`
+            the unix timestamp of when the request started
+        """
+
+        self.method = method
+        self.url = url
+        self.route = route
+        self.attempt = attempt
+        self.started_at = started_at
+
+    def __repr__(self) -> str:
+        return f"<RequestStartEvent method={self.method!r} route={self.route!r} attempt={self.attempt}>"
+
+
+class RequestEndEvent:
+    method: str
+    url: str
+    route: str
+    attempt: int
+    started_at: float
+    status: Optional[int]
+    error: Optional[BaseException]
+    connect: float
+    ttfb: float
+    read: float
+    duration: float
+    bytes_in: int
+    bytes_out: int
+
+    __slots__ = [
+        "method",
+        "url",
+        "route",
+        "attempt",
+        "started_at",
+        "status",
+        "error",
+        "connect",
+        "ttfb",
+        "read",
+        "duration",
+        "bytes_in",
+        "bytes_out",
+    ]
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        url: str,
+        route: str,
+        attempt: int,
+        started_at: float,
+        status: Optional[int],
+        error: Optional[BaseException],
+        connect: float,
+        ttfb: float,
+        read: float,
+        duration: float,
+        bytes_in: int,
+        bytes_out: int,
+    ):
+        """Passed to `ciberedev.client.Client.on_request_end`. You should not be creating these yourself
+
+        Attributes
+        ----------
+        method: `str`
+            the request's method. Ex: 'GET'
+        url: `str`
+            the request's url
+        route: `str`
+            the api route. Ex: '/screenshot'
+        attempt: `int`
+            the attempt, starting at `1`
+        started_at: `float`
+            the unix timestamp of when the request started
+        status: Optional[`int`]
+            the response's status code. `None` if the request failed without a response
+        error: Optional[`BaseException`]
+            the error the request failed with, if it failed without a response
+        connect: `float`
+            how long opening a connection took, in seconds. `0` if a connection was reused
+        ttfb: `float`
+            how long the api took to send the response headers after the connection was opened, in seconds
+        read: `float`
+            how long reading the response body took, in seconds
+        duration: `float`
+            how long the whole request took, in seconds
+        bytes_in: `int`
+            the size of the response body, in bytes
+        bytes_out: `int`
+            the size of the request body, in bytes
+        """
+
+        self.method = method
+        self.url = url
+        self.route = route
+        self.attempt = attempt
+        self.started_at = started_at
+        self.status = status
+        self.error = error
+        self.connect = connect
+        self.ttfb = ttfb
+        self.read = read
+        self.duration = duration
+        self.bytes_in = bytes_in
+        self.bytes_out = bytes_out
+
+    def __repr__(self) -> str:
+        return f"<RequestEndEvent method={self.method!r} route={self.route!r} status={self.status} duration={self.duration:.3f}>"
+
+
+class RetryEvent:
+    method: str
+    url: str
+    route: str
+    attempt: int
+    delay: float
+    reason: str
+    error: BaseException
+
+    __slots__ = ["method", "url", "route", "attempt", "delay", "reason", "error"]
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        url: str,
+        route: str,
+        attempt: int,
+        delay: float,
+        reason: str,
+        error: BaseException,
+    ):
+        """Passed to `ciberedev.client.Client.on_retry`. You should not be creating these yourself
+
+        Attributes
+        ----------
+        method: `str`
+            the request's method. Ex: 'GET'
+        url: `str`
+            the request's url
+        route: `str`
+            the api route. Ex: '/screenshot'
+        attempt: `int`
+            the attempt that failed, starting at `1`
+        delay: `float`
+            how long, in seconds, the client waits before retrying
+        reason: `str`
+            why the attempt failed. Ex: 'a 503 status code'
+        error: `BaseException`
+            the error that would have been raised if the request was not retried
+        """
+
+        self.method = method
+        self.url = url
+        self.route = route
+        self.attempt = attempt
+        self.delay = delay
+        self.reason = reason
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"<RetryEvent route={self.route!r} attempt={self.attempt} delay={self.delay:.2f}>"
+
+
+class CacheHitEvent:
+    cache: Literal["memory", "disk"]
+    name: str
+    key: Hashable
+
+    __slots__ = ["cache", "name", "key"]
+
+    def __init__(self, *, cache: Literal["memory", "disk"], name: str, key: Hashable):
+        """Passed to `ciberedev.client.Client.on_cache_hit`. You should not be creating these yourself
+
+        Attributes
+        ----------
+        cache: Literal['memory', 'disk']
+            which cache answered the call. `'memory'` is `ciberedev.cache.ResponseCache`, and `'disk'` is `ciberedev.cache.DiskCache`
+        name: `str`
+            the api route for the memory cache, Ex: '/search', or the client method for the disk cache, Ex: 'take_screenshot'
+        key: `Hashable`
+            the cache key
+        """
+
+        self.cache = cache
+        self.name = name
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f"<CacheHitEvent cache={self.cache!r} name={self.name!r}>"
+
+
+class ImageDownloadedEvent:
+    url: str
+    size: int
+    started_at: float
+    duration: float
+    streamed: bool
+
+    __slots__ = ["url", "size", "started_at", "duration", "streamed"]
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        size: int,
+        started_at: float,
+        duration: float,
+        streamed: bool,
+    ):
+        """Passed to `ciberedev.client.Client.on_image_downloaded`. You should not be creating these yourself
+
+        Attributes
+        ----------
+        url: `str`
+            the image's url
+        size: `int`
+            the size of the image, in bytes
+        started_at: `float`
+            the unix timestamp of when the download started
+        duration: `float`
+            how long the download took, in seconds
+        streamed: `bool`
+            whether the image was streamed through a `ciberedev.file.StreamedFile`
+        """
+
+        self.url = url
+        self.size = size
+        self.started_at = started_at
+        self.duration = duration
+        self.streamed = streamed
+
+    def __repr__(self) -> str:
+        return f"<ImageDownloadedEvent url={self.url!r} size={self.size} duration={self.duration:.3f}>"
+
+
+class OpenTelemetryTracer:
+    __slots__ = ["_tracer"]
+
+    def __init__(self, tracer: Any = None):
+        """Turns the client's requests into OpenTelemetry spans
+
+        When passed to `ciberedev.client.Client` via the `tracer` kwarg, every request to the api and every image download
+        becomes a client span, which is a child of the span that is active when the client's method is called.
+        Retries and cache hits are added as events to the active span. This requires `opentelemetry-api` to be installed
+
+        Parameters
+        ----------
+        tracer: Optional[`opentelemetry.trace.Tracer`]
+            the tracer the spans are created with. Defaults to `opentelemetry.trace.get_tracer("ciberedev")`
+
+        Raises
+        ----------
+        RuntimeError
+            `opentelemetry-api` is not installed
+        """
+
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise RuntimeError(
+                "'opentelemetry-api' must be installed to use the OpenTelemetryTracer"
+            ) from None
+
+        self._tracer = tracer or trace.get_tracer("ciberedev")
+
+    def __repr__(self) -> str:
+        return f"<OpenTelemetryTracer tracer={self._tracer!r}>"
+
+    def dispatch(self, name: str, event: Any) -> None:
+        """Handles one of the client's events. This is called by the client
+
+        Parameters
+        ----------
+        name: `str`
+            the name of the event. Ex: 'request_end'
+        event: `Any`
+            the event
+        """
+
+        if isinstance(event, RequestEndEvent):
+            self._request_end(event)
+        elif isinstance(event, ImageDownloadedEvent):
+            self._image_downloaded(event)
+        elif isinstance(event, RetryEvent):
+            self._add_event(
+                "retry",
+                {
+                    "ciberedev.route": event.route,
+                    "ciberedev.attempt": event.attempt,
+                    "ciberedev.retry_delay": event.delay,
+                    "ciberedev.retry_reason": event.reason,
+                },
+            )
+        elif isinstance(event, CacheHitEvent):
+            self._add_event(
+                "cache_hit",
+                {"ciberedev.cache": event.cache, "ciberedev.name": event.name},
+            )
+
+    def _add_event(self, name: str, attributes: dict[str, Any]) -> None:
+        from opentelemetry import trace
+
+        trace.get_current_span().add_event(name, attributes)
+
+    def _request_end(self, event: RequestEndEvent) -> None:
+        from opentelemetry.trace import SpanKind, Status, StatusCode
+
+        started_at = int(event.started_at * 1e9)
+        span = self._tracer.start_span(
+            f"{event.method} {event.route}",
+            kind=SpanKind.CLIENT,
+            start_time=started_at,
+            attributes={
+                "http.request.method": event.method,
+                "url.full": event.url,
+                "ciberedev.route": event.route,
+                "ciberedev.attempt": event.attempt,
+                "ciberedev.connect": event.connect,
+                "ciberedev.ttfb": event.ttfb,
+                "ciberedev.read": event.read,
+                "http.request.body.size": event.bytes_out,
+                "http.response.body.size": event.bytes_in,
+            },
+        )
+
+        if event.status is not None:
+            span.set_attribute("http.response.status_code", event.status)
+            if event.status >= 400:
+                span.set_status(Status(StatusCode.ERROR))
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, type(event.error).__name__))
+
+        span.end(end_time=started_at + int(event.duration * 1e9))
+
+    def _image_downloaded(self, event: ImageDownloadedEvent) -> None:
+        from opentelemetry.trace import SpanKind
+
+        started_at = int(event.started_at * 1e9)
+        span = self._tracer.start_span(
+            "GET image",
+            kind=SpanKind.CLIENT,
+            start_time=started_at,
+            attributes={
+                "http.request.method": "GET",
+                "url.full": event.url,
+                "http.response.body.size": event.size,
+                "ciberedev.streamed": event.streamed,
+            },
+        )
+        span.end(end_time=started_at + int(event.duration * 1e9))
+
+
+class RequestTrace:
+    """Collects the timings of a single request that aiohttp only exposes through its trace hooks.
+
+    Passed to aiohttp as the `trace_request_ctx` of the request.
+    """
+
+    route: str
+    attempt: int
+    connect: float
+    bytes_out: int
+
+    __slots__ = [
+        "route",
+        "attempt",
+        "connect",
+        "bytes_out",
+        "_on_start",
+        "_connect_started_at",
+    ]
+
+    def __init__(
+        self,
+        route: str,
+        attempt: int,
+        on_start: Optional[Callable[[RequestStartEvent], None]] = None,
+    ):
+        self.route = route
+        self.attempt = attempt
+        self.connect = 0.0
+        self.bytes_out = 0
+        self._on_start = on_start
+        self._connect_started_at: Optional[float] = None
+
+
+def _get_trace(context: SimpleNamespace) -> Optional[RequestTrace]:
+    trace = context.trace_request_ctx
+    return trace if isinstance(trace, RequestTrace) else None
+
+
+async def _on_request_start(
+    session: ClientSession,
+    context: SimpleNamespace,
+    params: TraceRequestStartParams,
+) -> None:
+    trace = _get_trace(context)
+    if trace is not None and trace._on_start is not None:
+        trace._on_start(
+            RequestStartEvent(
+                method=params.method,
+                url=str(params.url),
+                route=trace.route,
+                attempt=trace.attempt,
+                started_at=time.time(),
+            )
+        )
+
+
+async def _on_connection_create_start(
+    session: ClientSession,
+    context: SimpleNamespace,
+    params: TraceConnectionCreateStartParams,
+) -> None:
+    trace = _get_trace(context)
+    if trace is not None:
+        trace._connect_started_at = time.perf_counter()
+
+
+async def _on_connection_create_end(
+    session: ClientSession,
+    context: SimpleNamespace,
+    params: TraceConnectionCreateEndParams,
+) -> None:
+    trace = _get_trace(context)
+    if trace is not None and trace._connect_started_at is not None:
+        trace.connect += time.perf_counter() - trace._connect_started_at
+        trace._connect_started_at = None
+
+
+async def _on_request_chunk_sent(
+    session: ClientSession,
+    context: SimpleNamespace,
+    params: TraceRequestChunkSentParams,
+) -> None:
+    trace = _get_trace(context)
+    if trace is not None:
+        trace.bytes_out += len(params.chunk)
+
+
+class _TraceConfig(TraceConfig):
+    pass
+
+
+def create_trace_config() -> TraceConfig:
+    config = _TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_connection_create_start.append(_on_connection_create_start)
+    config.on_connection_create_end.append(_on_connection_create_end)
+    config.on_request_chunk_sent.append(_on_request_chunk_sent)
+    return config
+
+
+def attach_trace_config(session: ClientSession) -> None:
+    """Adds the client's trace config to a session that was not created by the client
+
+    This changes the session in place. The trace config only records requests made by the client, and ignores the session's other requests
+    """
+
+    if any(isinstance(config, _TraceConfig) for config in session.trace_configs):
+        return
+
+    config = create_trace_config()
+    config.freeze()
+    session.trace_configs.append(config)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Optional, Union
+
+from aiohttp import MultipartWriter
+
+from .file import File
+
+__all__ = []
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+UploadSource = Union[
+    bytes,
+    bytearray,
+    memoryview,
+    "os.PathLike[str]",
+    BinaryIO,
+    AsyncIterable[bytes],
+    File,
+]
+
+
+async def _read_file(file: BinaryIO) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    while chunk := await loop.run_in_executor(None, file.read, UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+async def _read_path(path: os.PathLike[str]) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    file: BinaryIO = await loop.run_in_executor(None, open, path, "rb")
+    try:
+        async for chunk in _read_file(file):
+            yield chunk
+    finally:
+        await loop.run_in_executor(None, file.close)
+
+
+def _tell(file: BinaryIO) -> Optional[int]:
+    try:
+        if file.seekable():
+            return file.tell()
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+class Upload:
+    """An image that is sent to the api as a multipart/form-data body, without loading it into memory first.
+
+    Bytes are sent as is, while paths, file objects and async iterables are streamed in chunks.
+    The body is rebuilt for every attempt, so it can be retried as long as the source can be read again.
+    """
+
+    __slots__ = ["source", "name", "fields", "replayable", "_start"]
+
+    def __init__(
+        self,
+        source: UploadSource,
+        *,
+        name: str = "bytes",
+        fields: Optional[dict[str, Any]] = None,
+    ):
+        if isinstance(source, File):
+            source = source._path if source._view is None else source._view  # type: ignore
+
+        self.source = source
+        self.name = name
+        self.fields = fields or {}
+        self._start: Optional[int] = None
+
+        if isinstance(source, (bytes, bytearray, memoryview, str, os.PathLike)):
+            self.replayable = True
+        elif isinstance(source, io.IOBase) or hasattr(source, "read"):
+            self._start = _tell(source)  # type: ignore
+            self.replayable = self._start is not None
+        elif isinstance(source, AsyncIterable):
+            self.replayable = False
+        else:
+            raise TypeError(
+                f"Can not upload an object of type {type(source).__name__!r}"
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"<Upload source={type(self.source).__name__} replayable={self.replayable}>"
+        )
+
+    def build(self) -> MultipartWriter:
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            payload: Any = source
+        elif isinstance(source, (str, os.PathLike)):
+            payload = _read_path(source)
+        elif isinstance(source, AsyncIterable):
+            payload = source
+        else:
+            if self._start is not None:
+                source.seek(self._start)  # type: ignore
+            payload = _read_file(source)  # type: ignore
+
+        writer = MultipartWriter("form-data")
+        for name, value in self.fields.items():
+            part = writer.append(str(value))
+            part.set_content_disposition("form-data", name=name)
+
+        part = writer.append(payload, {"Content-Type": "application/octet-stream"})
+        part.set_content_disposition("form-data", name=self.name, filename="image")
+        return writer
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import ipaddress
+import re
+from functools import lru_cache
+from typing import Optional
+
+from yarl import URL
+
+__all__ = []
+
+URL_CACHE_SIZE = 4096
+SCHEMES = frozenset({"http", "https", "ftp", "ftps"})
+# a single label of an idna encoded hostname. Unlike a regex over the whole url, this can not backtrack
+LABEL_REGEX = re.compile(r"[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?")
+# only a scheme at the start of the url counts, so urls with another url in their query still get the default scheme
+SCHEME_REGEX = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*://")
+# whitespace and control characters, which are sent to the api as is and would break the url
+INVALID_CHARACTERS_REGEX = re.compile(r"[\s\x00-\x1f\x7f]")
+
+
+def _is_valid_host(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        pass
+    else:
+        return True
+
+    if len(host) > 253:
+        return False
+
+    if host.endswith("."):
+        host = host[:-1]
+
+    labels = host.split(".")
+    # hostnames need a top level domain of atleast 2 characters that isn't all digits, like the api expects
+    tld = labels[-1]
+    if len(labels) < 2 or len(tld) < 2 or tld.isdigit():
+        return False
+    return all(LABEL_REGEX.fullmatch(label) for label in labels)
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def normalize_url(url: str, *, default_scheme: Optional[str] = None) -> str:
+    """Validates a url, and returns it in the form it is sent to the api in
+
+    Surrounding whitespace and `<>` are removed, and the default scheme is added. Otherwise the url is left as is.
+    Urls with whitespace, control characters or user info are invalid.
+    Internationalized hostnames and IPv6 hosts are supported. Results are cached, so validating the same url again is a dict lookup.
+
+    Parameters
+    ----------
+    url: `str`
+        the url
+    default_scheme: Optional[`str`]
+        the scheme added to urls without one. Ex: `'http'`. If not given, urls without a scheme are invalid
+
+    Raises
+    ----------
+    TypeError
+        The url is invalid
+
+    Returns
+    ----------
+    str
+        the normalized url
+    """
+
+    url = url.strip()
+    if url.startswith("<"):
+        url = url[1:]
+    if url.endswith(">"):
+        url = url[:-1]
+    if INVALID_CHARACTERS_REGEX.search(url):
+        raise TypeError("Invalid URL Given")
+    if default_scheme is not None and not SCHEME_REGEX.match(url):
+        url = f"{default_scheme}://{url}"
+
+    try:
+        parsed = URL(url)
+        host = parsed.raw_host
+        # accessing the port validates it
+        parsed.port
+    except (ValueError, UnicodeError):
+        raise TypeError("Invalid URL Given") from None
+
+    if parsed.scheme not in SCHEMES or not host or not _is_valid_host(host):
+        raise TypeError("Invalid URL Given")
+    # urls like 'mailto:x@a.com' would be sent with 'mailto:x' as their user info
+    if parsed.raw_user is not None or parsed.raw_password is not None:
+        raise TypeError("Invalid URL Given")
+
+    # the url is returned as it was given, since yarl would requote it, changing urls like '?q=%2F'
+    return url
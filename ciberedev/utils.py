@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar, Union
+
+from .timeouts import unscoped_context
+
+try:
+    import orjson
+except ImportError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+__all__ = []
+
+T = TypeVar("T")
+
+
+def from_json(data: Union[str, bytes]) -> Any:
+    """Parses json using orjson if it is installed, and the standard library otherwise"""
+
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _consume_result(task: asyncio.Task[Any]) -> None:
+    # stops "Task exception was never retrieved" warnings when every caller got cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight(Generic[T]):
+    """Makes concurrent calls with the same key share one call.
+
+    The shared call runs in its own task, so one of the callers being cancelled or timing out does not
+    cancel it for the others.
+    """
+
+    __slots__ = ["_calls"]
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        try:
+            task = self._calls[key]
+        except KeyError:
+            # tasks copy the context they are created in, which would bind the shared call to this caller's timeout
+            task = unscoped_context().run(asyncio.ensure_future, func())
+            self._calls[key] = task
+            task.add_done_callback(_consume_result)
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return await asyncio.shield(task)
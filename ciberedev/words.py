@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Optional
+
+from .errors import NotEnoughWords
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .client import Client
+
+__all__ = ["RandomWordPool"]
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RandomWordPool:
+    chunk_size: int
+    low_water_mark: int
+
+    __slots__ = [
+        "chunk_size",
+        "low_water_mark",
+        "_client",
+        "_words",
+        "_refill_task",
+        "_error",
+    ]
+
+    def __init__(
+        self,
+        client: Client,
+        /,
+        *,
+        chunk_size: int = 500,
+        low_water_mark: int = 100,
+    ):
+        """Creates a pool of random words, which are fetched from the api in bulk ahead of time
+
+        Words are taken from a local buffer, so taking them does not wait on the api.
+        Once the buffer drops below `low_water_mark` words, `chunk_size` more are fetched in the background.
+
+        Parameters
+        ----------
+        client: `ciberedev.client.Client`
+            the client the words are fetched with
+        chunk_size: `int`
+            The amount of words fetched at once. Defaults to `500`
+        low_water_mark: `int`
+            The amount of buffered words below which more are fetched. Defaults to `100`
+
+        Attributes
+        ----------
+        chunk_size: `int`
+            The amount of words fetched at once
+        low_water_mark: `int`
+            The amount of buffered words below which more are fetched
+        """
+
+        if chunk_size < 1:
+            raise TypeError("chunk_size must be atleast 1")
+        if low_water_mark < 0:
+            raise TypeError("low_water_mark can not be in the negatives")
+
+        self.chunk_size = chunk_size
+        self.low_water_mark = low_water_mark
+        self._client = client
+        self._words: deque[str] = deque()
+        self._refill_task: Optional[asyncio.Task[int]] = None
+        self._error: Optional[Exception] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<RandomWordPool words={len(self._words)} refilling={self.is_refilling()}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    async def __aenter__(self) -> Self:
+        await self.fill()
+        return self
+
+    async def __aexit__(
+        self, exception_type, exception_value, exception_traceback
+    ) -> None:
+        await self.close()
+
+    def is_refilling(self) -> bool:
+        """Returns a bool depending on if words are being fetched or not
+
+        Returns
+        ----------
+        bool
+            True if words are being fetched, False if they are not
+        """
+
+        return self._refill_task is not None and not self._refill_task.done()
+
+    async def _refill(self) -> int:
+        # returns the amount of words added, which can be less than `chunk_size` if the api gives less
+        try:
+            words = await self._client.get_random_words(self.chunk_size)
+        except Exception as e:
+            # the error is raised to whoever is waiting on words, instead of being lost in the task
+            LOGGER.warning("Failed to refill the random word pool: %r", e)
+            self._error = e
+            return 0
+
+        self._error = None
+        self._words.extend(words)
+        return len(words)
+
+    def _start_refill(self) -> asyncio.Task[int]:
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill())
+        return self._refill_task
+
+    def _maybe_refill(self) -> None:
+        if len(self._words) < self.low_water_mark:
+            self._start_refill()
+
+    async def _wait_for_refill(self, amount: int) -> None:
+        # shielded so a cancelled caller does not cancel the refill other callers are waiting on
+        added = await asyncio.shield(self._start_refill())
+        if added:
+            return
+
+        # the refill added nothing, so waiting on another one would loop forever
+        if self._error is not None:
+            raise self._error
+        raise NotEnoughWords(amount, len(self._words))
+
+    async def fill(self) -> None:
+        """|coro|
+
+        Fetches words until the pool has more than `low_water_mark` of them
+
+        This is automatically called when the pool is used as a context manager
+
+        Raises
+        ----------
+        HTTPException
+            The words could not be fetched
+        NotEnoughWords
+            The api gave no words
+        """
+
+        while len(self._words) <= self.low_water_mark:
+            await self._wait_for_refill(self.low_water_mark + 1)
+
+    def get_nowait(self, amount: int = 1, /) -> list[str]:
+        """Takes words from the pool without waiting, fetching more in the background if it is running low
+
+        This has to be called from the event loop's thread
+
+        Parameters
+        ----------
+        amount: `int`
+            the amount of words. Defaults to `1`
+
+        Raises
+        ----------
+        NotEnoughWords
+            The pool does not have enough words buffered
+
+        Returns
+        ----------
+        list[`str`]
+            the words
+        """
+
+        if amount < 1:
+            raise TypeError("amount must be atleast 1")
+
+        words = self._words
+        if amount > len(words):
+            self._start_refill()
+            raise NotEnoughWords(amount, len(words))
+
+        taken = [words.popleft() for _ in range(amount)]
+        self._maybe_refill()
+        return taken
+
+    async def take(self, amount: int = 1, /) -> list[str]:
+        """|coro|
+
+        Takes words from the pool, waiting for more to be fetched if it does not have enough
+
+        Parameters
+        ----------
+        amount: `int`
+            the amount of words. Defaults to `1`
+
+        Raises
+        ----------
+        HTTPException
+            The pool ran out of words, and more could not be fetched
+        NotEnoughWords
+            The pool ran out of words, and the api gave no more
+
+        Returns
+        ----------
+        list[`str`]
+            the words
+        """
+
+        while amount > len(self._words):
+            await self._wait_for_refill(amount)
+
+        return self.get_nowait(amount)
+
+    async def close(self) -> None:
+        """|coro|
+
+        Stops fetching words in the background. The buffered words can still be taken
+        """
+
+        task = self._refill_task
+        self._refill_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,31 @@
+import asyncio
+
+import ciberedev
+
+# creating our client instance
+client = ciberedev.Client()
+
+
+async def main():
+    # starting our client with a context manager
+    async with client:
+        # building our pipeline. Each step is given the link of the previous step's image,
+        # so only the final image is downloaded
+        pipeline = (
+            client.pipeline()
+            .take_screenshot("www.google.com")
+            .add_text_to_image("Hello World", text_color=(255, 0, 0))
+            .invert_image()
+        )
+
+        # running the pipeline
+        file = await pipeline.run()
+
+        # saving the final image
+        await file.save("google.png")
+
+
+# checking if this file is the one that was run
+if __name__ == "__main__":
+    # if so, run the main function
+    asyncio.run(main())
@@ -0,0 +1,26 @@
+import asyncio
+
+import ciberedev
+
+# creating our pool config. Here we allow up to 20 connections, keep idle connections
+# alive for a minute, and open 5 connections as soon as the client starts
+pool = ciberedev.PoolConfig(limit=20, keepalive_timeout=60, prewarm=5)
+
+# creating our client instance, and passing our pool config
+client = ciberedev.Client(pool=pool)
+
+
+async def main():
+    # starting our client with a context manager, which opens the prewarmed connections
+    async with client:
+        # taking 5 screenshots at once, which can all use one of the already open connections
+        screenshots = await asyncio.gather(
+            *[client.take_screenshot("www.google.com") for _ in range(5)]
+        )
+        print([screenshot.url for screenshot in screenshots])
+
+
+# checking if this file is the one that was run
+if __name__ == "__main__":
+    # if so, run the main function
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+import asyncio
+
+from aiohttp import web
+
+import ciberedev
+
+# creating our client instance
+client = ciberedev.Client()
+
+
+async def metrics(request: web.Request) -> web.Response:
+    # exporting the client's metrics in the prometheus text format
+    return web.Response(text=client.metrics.to_prometheus())
+
+
+async def main():
+    # starting a small web server that prometheus can scrape
+    app = web.Application()
+    app.router.add_get("/metrics", metrics)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "localhost", 8000).start()
+
+    async with client:
+        # sending some requests, so there is something to look at
+        await client.take_screenshot("www.google.com")
+        await client.get_search_results("cats")
+
+        # printing the 99th percentile latency of each route
+        for route, data in client.metrics.snapshot().items():
+            print(route, data["latency"]["total"]["p99"])
+
+        # keeping the server running, so it can be scraped
+        await asyncio.Event().wait()
+
+
+# checking if this file is the one that was run
+if __name__ == "__main__":
+    # if so, run the main function
+    asyncio.run(main())
@@ -0,0 +1,28 @@
+import asyncio
+
+import ciberedev
+
+# creating our client instance
+client = ciberedev.Client()
+
+
+# the function that processes our images
+# it is ran in another process, so it has to be defined at the top level of the file
+def get_size(view: memoryview) -> int:
+    # the view is only valid until this function returns, so we return what we need from it
+    return len(view)
+
+
+async def main():
+    # starting our client with a context manager
+    async with client:
+        # taking our screenshot, and processing it in another process
+        screenshot = await client.take_screenshot("www.google.com", process=get_size)
+        # printing the result of our function
+        print(screenshot.processed)
+
+
+# checking if this file is the one that was run
+if __name__ == "__main__":
+    # if so, run the main function
+    asyncio.run(main())
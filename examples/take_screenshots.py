@@ -0,0 +1,29 @@
+import asyncio
+
+import ciberedev
+
+# creating our client instance
+client = ciberedev.Client()
+
+URLS = ["www.google.com", "www.cibere.dev", "www.github.com", "www.python.org"]
+
+
+async def main():
+    # starting our client with a context manager
+    async with client:
+        # taking a screenshot of every url, with at most 2 being taken at once
+        async for url, result in client.take_screenshots(URLS, concurrency=2):
+            # if taking the screenshot failed, result is the error that was raised
+            if isinstance(result, Exception):
+                print(f"Failed to screenshot {url}: {result}")
+                continue
+
+            # saving the screenshot to a file
+            filename = url.replace(".", "-")
+            await result.save(f"{filename}.png")
+
+
+# checking if this file is the one that was run
+if __name__ == "__main__":
+    # if so, run the main function
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+import asyncio
+
+import ciberedev
+
+# creating our client instance
+client = ciberedev.Client()
+
+
+async def main():
+    # starting our client with a context manager
+    async with client:
+
+        # creating our word pool, which fetches 500 words at a time
+        # the context manager fills it before we use it, and stops it from fetching more once we are done
+        async with ciberedev.RandomWordPool(client, chunk_size=500) as pool:
+
+            # taking 5 words from the pool, which does not wait on the api
+            words = pool.get_nowait(5)
+
+            # printing our random words
+            print("\n".join(words))
+
+            # taking 10 more words, waiting for more to be fetched if the pool has run out
+            words = await pool.take(10)
+
+            # printing our random words
+            print("\n".join(words))
+
+
+# checking if this file is the one that was run
+if __name__ == "__main__":
+    # if so, run the main function
+    asyncio.run(main())
@@ -0,0 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import ciberedev
+
+# creating our sync client, which runs the client on a background thread
+# it can be shared between threads, so only create one for your whole app
+client = ciberedev.SyncClient()
+
+
+def get_link(url: str) -> str:
+    # taking our screenshot, this blocks until the screenshot is taken
+    screenshot = client.take_screenshot(url)
+    # returning the screenshots url
+    return screenshot.url
+
+
+def main():
+    # starting our client with a context manager, which also closes it for us
+    with client:
+        # taking screenshots from multiple threads, which all share the same connections
+        with ThreadPoolExecutor(4) as executor:
+            for link in executor.map(get_link, ["www.google.com", "www.python.org"]):
+                # printing the screenshots url
+                print(link)
+
+
+# checking if this file is the one that was run
+if __name__ == "__main__":
+    # if so, run the main function
+    main()
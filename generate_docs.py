@@ -41,6 +41,10 @@ pdoc.cli.main(args)
 
 MODULES_TO_REMOVE = [
     "http.html",
+    "ratelimits.html",
+    "uploads.html",
+    "urls.html",
+    "utils.html",
     "types/screenshot.html",
     "types/searching.html",
     "types/index.html",
@@ -24,6 +24,7 @@ setuptools.setup(
     version=ciberedev.__version__,
     python_requires=">=3.8",
     install_requires=REQUIREMENTS,
+    extras_require={"opentelemetry": ["opentelemetry-api"], "speed": ["orjson"]},
     packages=packages,
     description=ciberedev.__description__,
     long_description=LONG_DESCRIPTION,